@@ -5,8 +5,9 @@ import bcrypt
 from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from models import User, UserCreate
-from database import db_manager
+from database import WORKLOAD_META, Row, async_db_manager, db_manager
 from config import settings
+from principal_cache import principal_cache
 import logging
 import os
 from roles_utils import normalize_role, is_admin, is_user, get_default_role, get_admin_role, get_user_role
@@ -102,18 +103,34 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = verify_token(credentials.credentials)
-    if payload is None:
+    user = await get_user_from_token(credentials.credentials)
+    if user is None:
         raise credentials_exception
 
+    return user
+
+
+async def get_user_from_token(token: str) -> Optional[User]:
+    """Resolve a JWT to its user, or None; for transports without an Authorization header (WebSocket)
+
+    A token seen recently is answered from ``principal_cache`` without
+    decoding it again or reading ``app_users``.
+    """
+    principal, generation = principal_cache.get(token)
+    if principal is not None:
+        return principal.user
+
+    payload = verify_token(token)
+    if payload is None:
+        return None
+
     username = payload.get("sub")
     if username is None:
-        raise credentials_exception
-
-    user = get_user_by_username(username)
-    if user is None:
-        raise credentials_exception
+        return None
 
+    user = await get_user_by_username_async(username)
+    if user is not None:
+        principal_cache.set(token, payload, user, generation)
     return user
 
 
@@ -125,40 +142,48 @@ async def get_current_user_optional(
         return None
     
     try:
-        payload = verify_token(credentials.credentials)
-        if payload is None:
-            return None
-
-        username = payload.get("sub")
-        if username is None:
-            return None
-
-        user = get_user_by_username(username)
-        return user
+        return await get_user_from_token(credentials.credentials)
     except Exception:
         return None
 
 
+_USER_BY_USERNAME_SQL = (
+    "SELECT id, username, email, role, is_active, must_change_password, created_at, hidden_features "
+    "FROM app_users WHERE username = :1"
+)
+
+
+def _row_to_user(user_data: Row) -> User:
+    return User(
+        id=user_data["id"],
+        username=user_data["username"],
+        email=user_data["email"],
+        role=normalize_role(user_data.get("role", get_default_role())),
+        is_active=bool(user_data["is_active"]),
+        must_change_password=bool(user_data.get("must_change_password", 1)),
+        created_at=user_data["created_at"],
+        hidden_features=_parse_hidden_features(user_data.get("hidden_features")),
+    )
+
+
 def get_user_by_username(username: str) -> Optional[User]:
     """Get user by username from database"""
     try:
-        result = db_manager.execute_query(
-            "SELECT id, username, email, role, is_active, must_change_password, created_at, hidden_features "
-            "FROM app_users WHERE username = :1",
-            (username,),
-        )
+        result = db_manager.execute_query_rows(_USER_BY_USERNAME_SQL, (username,), workload=WORKLOAD_META)
         if result:
-            user_data = result[0]
-            return User(
-                id=user_data["id"],
-                username=user_data["username"],
-                email=user_data["email"],
-                role=normalize_role(user_data.get("role", get_default_role())),
-                is_active=bool(user_data["is_active"]),
-                must_change_password=bool(user_data.get("must_change_password", 1)),
-                created_at=user_data["created_at"],
-                hidden_features=_parse_hidden_features(user_data.get("hidden_features")),
-            )
+            return _row_to_user(result[0])
+        return None
+    except Exception as e:
+        logger.error(f"Error getting user by username: {e}")
+        return None
+
+
+async def get_user_by_username_async(username: str) -> Optional[User]:
+    """Get user by username from database without blocking the event loop"""
+    try:
+        result = await async_db_manager.execute_query_rows(_USER_BY_USERNAME_SQL, (username,), workload=WORKLOAD_META)
+        if result:
+            return _row_to_user(result[0])
         return None
     except Exception as e:
         logger.error(f"Error getting user by username: {e}")
@@ -168,10 +193,11 @@ def get_user_by_username(username: str) -> Optional[User]:
 def get_user_by_email(email: str) -> Optional[User]:
     """Get user by email from database"""
     try:
-        result = db_manager.execute_query(
+        result = db_manager.execute_query_rows(
             "SELECT id, username, email, role, is_active, must_change_password, created_at, hidden_features "
             "FROM app_users WHERE email = :1",
             (email,),
+            workload=WORKLOAD_META,
         )
         if result:
             user_data = result[0]
@@ -194,10 +220,11 @@ def get_user_by_email(email: str) -> Optional[User]:
 def authenticate_user(username: str, password: str) -> Optional[User]:
     """Authenticate user with username and password"""
     try:
-        result = db_manager.execute_query(
+        result = db_manager.execute_query_rows(
             "SELECT id, username, email, password_hash, role, is_active, must_change_password, created_at, hidden_features "
             "FROM app_users WHERE username = :1",
             (username,),
+            workload=WORKLOAD_META,
         )
         if not result:
             return None
@@ -522,6 +549,7 @@ def get_query_by_id(query_id: int):
         result = db_manager.execute_query(
             "SELECT id, name, role FROM app_queries WHERE id = :1 AND is_active = 1",
             (query_id,),
+            workload=WORKLOAD_META,
         )
         if result:
             return result[0]
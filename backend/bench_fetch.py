@@ -0,0 +1,83 @@
+"""Compare the row-based and columnar fetch paths of DatabaseManager.
+
+Each path runs in its own child process so that the peak RSS reported for one
+does not include memory retained by the other.
+
+Usage::
+
+    python bench_fetch.py --sql "SELECT * FROM SAMPLE_BT" --repeat 3
+"""
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import time
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
+logger = logging.getLogger(__name__)
+
+PATHS = ("read_sql", "arrow")
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_single(path: str, sql: str) -> dict:
+    from database import db_manager
+
+    start = time.perf_counter()
+    if path == "read_sql":
+        df = db_manager.execute_query_pandas(sql, timeout=0)
+    else:
+        df = db_manager.execute_query_arrow(sql, timeout=0).to_pandas()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "path": path,
+        "rows": len(df),
+        "columns": len(df.columns),
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(len(df) / elapsed) if elapsed else 0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark read_sql vs Arrow fetch")
+    parser.add_argument("--sql", type=str, default="SELECT * FROM SAMPLE_BT", help="Query to fetch")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path")
+    parser.add_argument("--child", type=str, choices=PATHS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_single(args.child, args.sql)))
+        return 0
+
+    results = {path: [] for path in PATHS}
+    for _ in range(args.repeat):
+        for path in PATHS:
+            completed = subprocess.run(
+                [sys.executable, __file__, "--child", path, "--sql", args.sql],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            results[path].append(result)
+            logger.info(f"{path}: {result}")
+
+    print(f"\n{'path':<10} {'rows':>10} {'best s':>8} {'rows/sec':>12} {'peak RSS MB':>12}")
+    for path, runs in results.items():
+        best = min(runs, key=lambda r: r["seconds"])
+        peak = max(r["peak_rss_mb"] for r in runs)
+        print(f"{path:<10} {best['rows']:>10} {best['seconds']:>8} {best['rows_per_sec']:>12} {peak:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Compare row-by-row inserts with array-bound batch inserts.
+
+Loads the same synthetic rows into a scratch table once with one
+``execute_non_query`` per row (how the report importer used to work) and
+once through ``execute_many``, then reports rows/sec for each. The scratch
+table is created before and dropped after the run.
+
+Usage::
+
+    python bench_import.py --rows 20000 --batch-size 5000
+"""
+
+import argparse
+import datetime
+import logging
+import sys
+import time
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
+logger = logging.getLogger(__name__)
+
+TABLE = "BENCH_IMPORT_TMP"
+INSERT_SQL = f"INSERT INTO {TABLE} (id, name, amount, booked_at) VALUES (:1, :2, :3, :4)"
+
+
+def make_rows(count: int) -> list:
+    base = datetime.datetime(2024, 1, 1)
+    return [
+        (i, f"account-{i % 997}", round(i * 1.37, 2), base + datetime.timedelta(minutes=i))
+        for i in range(count)
+    ]
+
+
+def reset_table(db_manager) -> None:
+    try:
+        db_manager.execute_non_query(f"DROP TABLE {TABLE} PURGE")
+    except Exception:
+        pass
+    db_manager.execute_non_query(
+        f"CREATE TABLE {TABLE} (id NUMBER PRIMARY KEY, name VARCHAR2(100), amount NUMBER(18,2), booked_at DATE)"
+    )
+
+
+def run_row_by_row(db_manager, rows: list) -> float:
+    start = time.perf_counter()
+    for values in rows:
+        db_manager.execute_non_query(INSERT_SQL, values)
+    return time.perf_counter() - start
+
+
+def run_batched(db_manager, rows: list, batch_size: int) -> float:
+    start = time.perf_counter()
+    db_manager.execute_many(INSERT_SQL, rows, batch_size=batch_size, batch_errors=True, commit_per_batch=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row-by-row vs array-bound inserts")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows to insert per path")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per executemany round trip")
+    parser.add_argument("--skip-row-by-row", action="store_true", help="Only run the batched path")
+    args = parser.parse_args()
+
+    from database import db_manager
+
+    rows = make_rows(args.rows)
+    results = []
+    try:
+        if not args.skip_row_by_row:
+            reset_table(db_manager)
+            results.append(("row_by_row", run_row_by_row(db_manager, rows)))
+            logger.info(f"row_by_row: {results[-1][1]:.2f}s")
+
+        reset_table(db_manager)
+        results.append(("batched", run_batched(db_manager, rows, args.batch_size)))
+        logger.info(f"batched: {results[-1][1]:.2f}s")
+    finally:
+        try:
+            db_manager.execute_non_query(f"DROP TABLE {TABLE} PURGE")
+        except Exception as exc:
+            logger.warning(f"Could not drop {TABLE}: {exc}")
+
+    print(f"\n{'path':<12} {'rows':>10} {'seconds':>10} {'rows/sec':>12}")
+    for path, seconds in results:
+        rate = round(args.rows / seconds) if seconds else 0
+        print(f"{path:<12} {args.rows:>10} {seconds:>10.2f} {rate:>12}")
+    if len(results) == 2 and results[1][1]:
+        print(f"\nspeedup: {results[0][1] / results[1][1]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
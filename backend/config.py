@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -13,6 +14,73 @@ class Settings:
     DB_USERNAME: str = os.getenv("DB_USERNAME", "system")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "admin123")
 
+    # Connection pool sizing (shared by the sync and asyncio pools). DB_POOL_MIN/MAX
+    # size the "interactive" pool; the other named pools override them below.
+    DB_POOL_MIN: int = int(os.getenv("DB_POOL_MIN", "2"))
+    DB_POOL_MAX: int = int(os.getenv("DB_POOL_MAX", "10"))
+    DB_POOL_INC: int = int(os.getenv("DB_POOL_INC", "1"))
+    # "meta" pool: per-request lookups (users, menus, query/layout/KPI definitions)
+    DB_POOL_META_MIN: int = int(os.getenv("DB_POOL_META_MIN", "1"))
+    DB_POOL_META_MAX: int = int(os.getenv("DB_POOL_META_MAX", "4"))
+    DB_POOL_META_ACQUIRE_TIMEOUT: float = float(os.getenv("DB_POOL_META_ACQUIRE_TIMEOUT", "5"))
+    # "bulk" pool: exports, imports and other long-running jobs
+    DB_POOL_BULK_MIN: int = int(os.getenv("DB_POOL_BULK_MIN", "0"))
+    DB_POOL_BULK_MAX: int = int(os.getenv("DB_POOL_BULK_MAX", "3"))
+    DB_POOL_BULK_ACQUIRE_TIMEOUT: float = float(os.getenv("DB_POOL_BULK_ACQUIRE_TIMEOUT", "60"))
+    # Seconds to wait for a free pooled connection before failing fast
+    DB_POOL_ACQUIRE_TIMEOUT: float = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", "10"))
+    # Idle seconds after which the pool pings a connection on acquire (negative disables)
+    DB_POOL_PING_INTERVAL: int = int(os.getenv("DB_POOL_PING_INTERVAL", "60"))
+    # busy/max ratio at or above which /health/ready reports not ready
+    DB_POOL_READY_SATURATION: float = float(os.getenv("DB_POOL_READY_SATURATION", "1.0"))
+
+    # Rows per array-bound INSERT round trip in report imports
+    IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "5000"))
+
+    # Background export jobs: spool directory for finished files, how long a
+    # finished file stays downloadable (seconds) and worker threads
+    EXPORT_SPOOL_DIR: str = os.getenv("EXPORT_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "analytics_exports"))
+    EXPORT_JOB_TTL: int = int(os.getenv("EXPORT_JOB_TTL", "3600"))
+    EXPORT_JOB_WORKERS: int = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+    # Partitioned exports: default rows per part and part writers run in parallel
+    EXPORT_PARTITION_ROWS: int = int(os.getenv("EXPORT_PARTITION_ROWS", "1000000"))
+    EXPORT_PARTITION_WORKERS: int = int(os.getenv("EXPORT_PARTITION_WORKERS", "4"))
+
+    # Query result cache: total and per-entry byte budget, and the default TTL
+    # (seconds) for saved queries whose chart_config sets no "cache_ttl"
+    # (0: only queries that set one are cached)
+    RESULT_CACHE_MAX_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(128 * 1024 * 1024)))
+    RESULT_CACHE_MAX_ENTRY_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRY_BYTES", str(8 * 1024 * 1024)))
+    RESULT_CACHE_TTL: float = float(os.getenv("RESULT_CACHE_TTL", "0"))
+
+    # Widget/KPI snapshots: how often the refresher looks for due queries
+    # (0 disables it), how many it refreshes at once, and their query timeout
+    SNAPSHOT_POLL_INTERVAL: float = float(os.getenv("SNAPSHOT_POLL_INTERVAL", "30"))
+    SNAPSHOT_CONCURRENCY: int = int(os.getenv("SNAPSHOT_CONCURRENCY", "2"))
+    SNAPSHOT_QUERY_TIMEOUT: int = int(os.getenv("SNAPSHOT_QUERY_TIMEOUT", "300"))
+
+    # KPI evaluation: connections used at once per request and the deadline
+    # (seconds) after which a KPI is reported stale/unavailable
+    KPI_CONCURRENCY: int = int(os.getenv("KPI_CONCURRENCY", "4"))
+    KPI_TIMEOUT: float = float(os.getenv("KPI_TIMEOUT", "10"))
+
+    # Widgets of one dashboard executed at the same time by the batch endpoint
+    DASHBOARD_WIDGET_CONCURRENCY: int = int(os.getenv("DASHBOARD_WIDGET_CONCURRENCY", "4"))
+    # Live dashboards: seconds between recomputations pushed to subscribers,
+    # and between keep-alive messages on idle SSE streams
+    DASHBOARD_PUSH_INTERVAL: float = float(os.getenv("DASHBOARD_PUSH_INTERVAL", "60"))
+    DASHBOARD_KEEPALIVE_INTERVAL: float = float(os.getenv("DASHBOARD_KEEPALIVE_INTERVAL", "15"))
+
+    # Query/widget/menu definition cache: seconds an entry may be served
+    # (bounds staleness in other worker processes; 0 disables) and entry cap
+    METADATA_CACHE_TTL: float = float(os.getenv("METADATA_CACHE_TTL", "300"))
+    METADATA_CACHE_MAX_ENTRIES: int = int(os.getenv("METADATA_CACHE_MAX_ENTRIES", "5000"))
+
+    # Authenticated user per token: seconds before the user row is re-read
+    # (0 disables) and how many tokens are kept
+    PRINCIPAL_CACHE_TTL: float = float(os.getenv("PRINCIPAL_CACHE_TTL", "30"))
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
+
     # JWT Configuration
     JWT_SECRET_KEY: str = os.getenv(
         "JWT_SECRET_KEY", "your-super-secret-jwt-key-change-this-in-production"
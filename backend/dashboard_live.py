@@ -0,0 +1,166 @@
+"""Live dashboard updates pushed to subscribers.
+
+Instead of every open browser re-polling every widget, clients subscribe to
+a dashboard (menu id, 0 for the default dashboard). One ``DashboardChannel``
+per dashboard recomputes each widget once per ``DASHBOARD_PUSH_INTERVAL``
+and fans the resulting payload out to all its subscribers, so the Oracle
+work grows with the number of widgets, not with the number of viewers.
+
+A widget is only pushed when its data changed since the previous refresh.
+Subscribers keep just the latest payload per widget, so a slow client
+skips intermediate refreshes instead of buffering them. A channel's refresh
+task runs while it has subscribers and stops with the last one.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config import settings
+from models import QueryResult, RoleType
+from services import DashboardService
+
+logger = logging.getLogger(__name__)
+
+# Seconds a widget query may run during a refresh
+WIDGET_TIMEOUT = 45
+
+
+class LiveSubscriber:
+    """One connected client; holds the newest undelivered payload per widget."""
+
+    def __init__(self, menu_id: int, user_role: RoleType):
+        self.menu_id = menu_id
+        self.user_role = user_role
+        self._pending: Dict[int, str] = {}
+        self._ready = asyncio.Event()
+
+    def offer(self, widget_id: int, message: str) -> None:
+        self._pending[widget_id] = message
+        self._ready.set()
+
+    async def next_messages(self) -> List[str]:
+        """Wait until something is pending and return it (oldest widget first)."""
+        await self._ready.wait()
+        self._ready.clear()
+        messages = list(self._pending.values())
+        self._pending.clear()
+        return messages
+
+
+class DashboardChannel:
+    """Refresh loop and subscriber set of one dashboard."""
+
+    def __init__(self, menu_id: int, interval: float):
+        self.menu_id = menu_id
+        self.interval = interval
+        self.subscribers: Set[LiveSubscriber] = set()
+        # widget id -> (query role, serialized payload, data fingerprint)
+        self._latest: Dict[int, Tuple[Optional[str], str, str]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._loop())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def add(self, subscriber: LiveSubscriber) -> None:
+        self.subscribers.add(subscriber)
+        # New subscribers start from the last computed state
+        for widget_id, (role, message, _) in self._latest.items():
+            if DashboardService.role_allows(role, subscriber.user_role):
+                subscriber.offer(widget_id, message)
+
+    def _publish(self, widget_id: int, role: Optional[str], message: str) -> None:
+        for subscriber in self.subscribers:
+            if DashboardService.role_allows(role, subscriber.user_role):
+                subscriber.offer(widget_id, message)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Live refresh of dashboard {self.menu_id} failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> None:
+        """Compute every widget of the dashboard once and push the ones that changed."""
+        rows = await DashboardService.get_widget_queries_async(self.menu_id or None)
+        semaphore = asyncio.Semaphore(settings.DASHBOARD_WIDGET_CONCURRENCY)
+
+        async def compute(row) -> None:
+            try:
+                async with semaphore:
+                    result = await DashboardService.widget_result_async(
+                        row["query_id"], row["sql_query"], row["chart_type"], row["chart_config"], WIDGET_TIMEOUT
+                    )
+            except Exception as exc:
+                logger.error(f"Live refresh of widget {row['id']} failed: {exc}")
+                result = QueryResult(success=False, error=str(exc))
+
+            dumped = result.model_dump(mode="json")
+            fingerprint = json.dumps([dumped["success"], dumped["data"], dumped["error"]], default=str)
+            previous = self._latest.get(row["id"])
+            if previous is not None and previous[2] == fingerprint:
+                return
+            message = json.dumps({"type": "widget", "widget_id": row["id"], "title": row["title"], "result": dumped}, default=str)
+            self._latest[row["id"]] = (row["role"], message, fingerprint)
+            self._publish(row["id"], row["role"], message)
+
+        await asyncio.gather(*(compute(row) for row in rows))
+        current = {row["id"] for row in rows}
+        for widget_id in [w for w in self._latest if w not in current]:
+            del self._latest[widget_id]
+        self.refreshes += 1
+
+
+class DashboardLiveHub:
+    """Creates a channel per subscribed dashboard and tears it down when unused."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._channels: Dict[int, DashboardChannel] = {}
+
+    def subscribe(self, menu_id: int, user_role: RoleType) -> LiveSubscriber:
+        channel = self._channels.get(menu_id)
+        if channel is None:
+            channel = self._channels[menu_id] = DashboardChannel(menu_id, self.interval)
+            channel.start()
+            logger.info(f"Live channel for dashboard {menu_id} started")
+        subscriber = LiveSubscriber(menu_id, user_role)
+        channel.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: LiveSubscriber) -> None:
+        channel = self._channels.get(subscriber.menu_id)
+        if channel is None:
+            return
+        channel.subscribers.discard(subscriber)
+        if not channel.subscribers:
+            channel.stop()
+            del self._channels[subscriber.menu_id]
+            logger.info(f"Live channel for dashboard {subscriber.menu_id} stopped")
+
+    def shutdown(self) -> None:
+        for channel in self._channels.values():
+            channel.stop()
+        self._channels.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channels": len(self._channels),
+            "subscribers": sum(len(c.subscribers) for c in self._channels.values()),
+            "refreshes": sum(c.refreshes for c in self._channels.values()),
+        }
+
+
+dashboard_live_hub = DashboardLiveHub(settings.DASHBOARD_PUSH_INTERVAL)
@@ -1,19 +1,451 @@
+import asyncio
+import datetime
+import decimal
+import heapq
 import logging
+import queue
+import threading
 import time
-from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import re
 
 import oracledb
 import pandas as pd
+import pyarrow as pa
 
 from config import settings
+from pool_metrics import PoolMetrics
 from roles_utils import get_default_role, get_admin_role
 
 logger = logging.getLogger(__name__)
 
 ParamType = Union[Sequence[Any], Dict[str, Any], None]
 
+# Driver/server errors raised when a call is interrupted by call_timeout or
+# conn.cancel(): DPY-4024/DPI-1067 (call timeout exceeded, Thin/Thick),
+# ORA-01013 (user requested cancel), ORA-03156 (OCI call timed out).
+TIMEOUT_ERROR_CODES = ("DPY-4024", "DPI-1067", "ORA-01013", "ORA-03156")
+
+
+class QueryTimeoutError(TimeoutError):
+    """Raised when a query exceeds its timeout and was cancelled on the server."""
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled connection became free within DB_POOL_ACQUIRE_TIMEOUT."""
+
+
+def _is_timeout_error(exc: BaseException) -> bool:
+    message = str(exc)
+    return any(code in message for code in TIMEOUT_ERROR_CODES)
+
+
+def _has_timeout(timeout: Optional[float]) -> bool:
+    return bool(timeout) and timeout > 0
+
+
+class _CallDeadline:
+    """Overall deadline of one ``get_connection`` block, armed on ``_call_watchdog``."""
+
+    __slots__ = ("conn", "at", "fired", "done", "_lock")
+
+    def __init__(self, conn, at: float):
+        self.conn = conn
+        self.at = at
+        self.fired = False
+        self.done = False
+        self._lock = threading.Lock()
+
+    def fire(self) -> None:
+        with self._lock:
+            if self.done:
+                return
+            self.fired = True
+            try:
+                self.conn.cancel()
+            except Exception as exc:
+                logger.error(f"Error cancelling timed out Oracle call: {exc}")
+
+    def disarm(self) -> bool:
+        """Stop the deadline; True if it already fired and cancelled the connection's call."""
+        with self._lock:
+            self.done = True
+            return self.fired
+
+
+class _CallWatchdog:
+    """Single daemon thread cancelling the Oracle calls whose overall deadline passed.
+
+    Deadlines sit in a heap ordered by expiry; disarmed ones are skipped
+    when they reach the top, so arming and disarming never start a thread.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, _CallDeadline]] = []
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def arm(self, conn, timeout: float) -> _CallDeadline:
+        deadline = _CallDeadline(conn, time.monotonic() + timeout)
+        with self._cond:
+            self._seq += 1
+            heapq.heappush(self._heap, (deadline.at, self._seq, deadline))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="oracle-call-watchdog", daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is deadline:
+                self._cond.notify()
+        return deadline
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    while self._heap and self._heap[0][2].done:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    wait = self._heap[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                _, _, deadline = heapq.heappop(self._heap)
+            deadline.fire()
+
+
+_call_watchdog = _CallWatchdog()
+
+
+# Workload classes, each served by its own named pool so that long exports and
+# imports cannot starve the per-request metadata lookups (login, menus, query
+# definitions) or interactive dashboard SQL.
+WORKLOAD_META = "meta"
+WORKLOAD_INTERACTIVE = "interactive"
+WORKLOAD_BULK = "bulk"
+WORKLOADS = (WORKLOAD_META, WORKLOAD_INTERACTIVE, WORKLOAD_BULK)
+
+
+def _pool_setting(workload: str, name: str, default: Any) -> Any:
+    """DB_POOL_<WORKLOAD>_<NAME> if defined, else the shared DB_POOL_<NAME>."""
+    if workload != WORKLOAD_INTERACTIVE:
+        value = getattr(settings, f"DB_POOL_{workload.upper()}_{name}", None)
+        if value is not None:
+            return value
+    return getattr(settings, f"DB_POOL_{name}", default)
+
+
+def _pool_options(workload: str) -> Dict[str, Any]:
+    """Sizing and acquire behaviour of one named pool (same for sync and asyncio)."""
+    return {
+        "min": int(_pool_setting(workload, "MIN", 2)),
+        "max": int(_pool_setting(workload, "MAX", 10)),
+        "increment": int(_pool_setting(workload, "INC", 1)),
+        # Wait at most the acquire timeout for a free connection instead of queueing forever
+        "getmode": oracledb.POOL_GETMODE_TIMEDWAIT,
+        "wait_timeout": int(float(_pool_setting(workload, "ACQUIRE_TIMEOUT", 10)) * 1000),
+        "ping_interval": int(_pool_setting(workload, "PING_INTERVAL", 60)),
+    }
+
+
+class Row:
+    """
+    Read-only, dict-like view over one result tuple.
+
+    All rows of a ResultSet share a single column-position map, so a row costs
+    one small slotted object instead of a dict. Lookups are case-insensitive
+    (Oracle reports unquoted column names in upper case).
+    """
+
+    __slots__ = ("_values", "_positions", "_columns")
+
+    def __init__(self, values: tuple, positions: Dict[str, int], columns: List[str]):
+        self._values = values
+        self._positions = positions
+        self._columns = columns
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._positions[key.lower()]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        pos = self._positions.get(key.lower())
+        return default if pos is None else self._values[pos]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.lower() in self._positions
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def keys(self) -> List[str]:
+        return list(self._columns)
+
+    def values(self) -> tuple:
+        return self._values
+
+    def items(self):
+        return zip(self._columns, self._values)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._columns, self._values))
+
+    def __repr__(self) -> str:
+        return f"Row({self.as_dict()!r})"
+
+
+class ResultSet:
+    """Query result holding the column names once plus the rows as plain tuples."""
+
+    __slots__ = ("columns", "rows", "_positions")
+
+    def __init__(self, columns: List[str], rows: List[tuple]):
+        self.columns = columns
+        self.rows = rows
+        self._positions = {name.lower(): idx for idx, name in enumerate(columns)}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __bool__(self) -> bool:
+        return bool(self.rows)
+
+    def __iter__(self):
+        positions, columns = self._positions, self.columns
+        return (Row(values, positions, columns) for values in self.rows)
+
+    def __getitem__(self, index: int) -> Row:
+        return Row(self.rows[index], self._positions, self.columns)
+
+    def position(self, name: str) -> int:
+        """Return the index of a column (case-insensitive)."""
+        return self._positions[name.lower()]
+
+    def column(self, name: str) -> List[Any]:
+        pos = self.position(name)
+        return [values[pos] for values in self.rows]
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        columns = self.columns
+        return [dict(zip(columns, values)) for values in self.rows]
+
+
+class BatchError:
+    """A row rejected by ``execute_many`` when batch errors are enabled."""
+
+    __slots__ = ("offset", "code", "message")
+
+    def __init__(self, offset: int, code: str, message: str):
+        self.offset = offset  # index into the rows passed to execute_many
+        self.code = code
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f"BatchError(offset={self.offset}, code={self.code!r}, message={self.message!r})"
+
+
+class ExecuteManyResult:
+    """Outcome of ``execute_many``: affected rows, rejected rows and round trips used."""
+
+    __slots__ = ("rowcount", "errors", "batches")
+
+    def __init__(self):
+        self.rowcount = 0
+        self.errors: List[BatchError] = []
+        self.batches = 0
+
+    def add_batch_errors(self, batch_errors, batch_start: int) -> None:
+        for err in batch_errors:
+            message = getattr(err, "message", str(err))
+            code = getattr(err, "full_code", None) or message.split(":", 1)[0]
+            self.errors.append(BatchError(batch_start + err.offset, code, message))
+
+    def __repr__(self) -> str:
+        return f"ExecuteManyResult(rowcount={self.rowcount}, errors={len(self.errors)}, batches={self.batches})"
+
+
+class BatchExecutionError(Exception):
+    """Raised by ``execute_many`` when a row fails and batch errors are disabled."""
+
+    def __init__(self, message: str, offset: Optional[int], result: "ExecuteManyResult"):
+        super().__init__(message)
+        self.offset = offset  # index of the failing row in the input (None if unknown)
+        self.result = result  # work that stayed committed (earlier batches with commit_per_batch)
+
+
+def _infer_input_sizes(rows: Sequence[Sequence[Any]]) -> Optional[List[Any]]:
+    """Bind types for positional rows whose first row contains None.
+
+    The driver types array binds from the first row and treats None as a
+    one-character string, so a later number, date or longer string in that
+    column would fail. Those columns are typed from their first non-None value
+    (strings sized to the longest value) instead.
+    """
+    first = rows[0]
+    if isinstance(first, dict) or None not in first:
+        return None
+    pending = [pos for pos, value in enumerate(first) if value is None]
+    types: Dict[int, Any] = {}
+    lengths: Dict[int, int] = {}
+    for row in rows:
+        for pos in pending:
+            value = row[pos]
+            if value is None:
+                continue
+            if isinstance(value, str):
+                lengths[pos] = max(lengths.get(pos, 1), len(value))
+            elif pos not in types:
+                if isinstance(value, (bool, int, float, decimal.Decimal)):
+                    types[pos] = oracledb.DB_TYPE_NUMBER
+                elif isinstance(value, datetime.datetime):
+                    types[pos] = oracledb.DB_TYPE_TIMESTAMP
+                elif isinstance(value, datetime.date):
+                    types[pos] = oracledb.DB_TYPE_DATE
+                elif isinstance(value, (bytes, bytearray)):
+                    types[pos] = oracledb.DB_TYPE_RAW
+    sizes: List[Any] = [None] * len(first)
+    for pos in pending:
+        sizes[pos] = lengths.get(pos) or types.get(pos)
+    return sizes
+
+
+def _arrow_type(type_code: Any, precision: Optional[int], scale: Optional[int]) -> pa.DataType:
+    """Arrow type for a result column, following the driver's data frame mapping."""
+    if type_code is oracledb.DB_TYPE_NUMBER:
+        if scale == 0 and precision and precision <= 18:
+            return pa.int64()
+        return pa.float64()
+    if type_code in (oracledb.DB_TYPE_BINARY_DOUBLE, oracledb.DB_TYPE_BINARY_FLOAT, oracledb.DB_TYPE_BINARY_INTEGER):
+        return pa.float64()
+    if type_code in (
+        oracledb.DB_TYPE_DATE,
+        oracledb.DB_TYPE_TIMESTAMP,
+        oracledb.DB_TYPE_TIMESTAMP_LTZ,
+        oracledb.DB_TYPE_TIMESTAMP_TZ,
+    ):
+        return pa.timestamp("us")
+    if type_code is oracledb.DB_TYPE_BOOLEAN:
+        return pa.bool_()
+    if type_code in (oracledb.DB_TYPE_RAW, oracledb.DB_TYPE_LONG_RAW, oracledb.DB_TYPE_BLOB):
+        return pa.large_binary()
+    return pa.large_string()
+
+
+def _arrow_schema(description: Sequence[Any]) -> pa.Schema:
+    """Arrow schema from ``cursor.description`` (name, type, ..., precision, scale, null_ok)."""
+    return pa.schema([pa.field(col[0], _arrow_type(col[1], col[4], col[5])) for col in description])
+
+
+def _rows_to_arrow(rows: Sequence[Sequence[Any]], schema: pa.Schema) -> pa.Table:
+    """Build a table of ``schema`` from fetched tuples (row-wise fallback path)."""
+    arrays = []
+    for pos, field in enumerate(schema):
+        values = []
+        for row in rows:
+            value = row[pos]
+            if value is not None:
+                if hasattr(value, "read"):  # LOB locator
+                    value = value.read()
+                if pa.types.is_large_string(field.type) and not isinstance(value, str):
+                    value = str(value)
+                elif pa.types.is_floating(field.type) and isinstance(value, decimal.Decimal):
+                    value = float(value)
+            values.append(value)
+        arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+# Column types ORA_HASH accepts; LOBs, LONGs, objects, JSON and vectors are left
+# out of slice hash expressions.
+HASHABLE_DB_TYPES = (
+    oracledb.DB_TYPE_NUMBER,
+    oracledb.DB_TYPE_BINARY_DOUBLE,
+    oracledb.DB_TYPE_BINARY_FLOAT,
+    oracledb.DB_TYPE_BINARY_INTEGER,
+    oracledb.DB_TYPE_VARCHAR,
+    oracledb.DB_TYPE_NVARCHAR,
+    oracledb.DB_TYPE_CHAR,
+    oracledb.DB_TYPE_NCHAR,
+    oracledb.DB_TYPE_DATE,
+    oracledb.DB_TYPE_TIMESTAMP,
+    oracledb.DB_TYPE_TIMESTAMP_LTZ,
+    oracledb.DB_TYPE_TIMESTAMP_TZ,
+    oracledb.DB_TYPE_RAW,
+    oracledb.DB_TYPE_ROWID,
+    oracledb.DB_TYPE_INTERVAL_DS,
+    oracledb.DB_TYPE_INTERVAL_YM,
+)
+# Columns folded into the default slice hash
+SLICE_HASH_MAX_COLUMNS = 8
+
+SLICE_STRATEGIES = ("auto", "rowid", "hash")
+
+# ROWID ranges covering a table's extents, cut into :slices groups of
+# consecutive extents in ROWID order (data object, file, block). Bigfile
+# tablespaces encode ROWIDs differently and are left to hash slicing.
+ROWID_RANGES_SQL = """
+SELECT ROWIDTOCHAR(MIN(DBMS_ROWID.ROWID_CREATE(1, data_object_id, relative_fno, block_id, 0))) AS lo,
+       ROWIDTOCHAR(MAX(DBMS_ROWID.ROWID_CREATE(1, data_object_id, relative_fno, block_id + blocks - 1, 32767))) AS hi
+FROM (
+    SELECT o.data_object_id, e.relative_fno, e.block_id, e.blocks,
+           NTILE(:slices) OVER (ORDER BY o.data_object_id, e.relative_fno, e.block_id) AS grp
+    FROM user_extents e
+    JOIN user_objects o
+      ON o.object_name = e.segment_name
+     AND NVL(o.subobject_name, '-') = NVL(e.partition_name, '-')
+     AND o.object_type IN ('TABLE', 'TABLE PARTITION', 'TABLE SUBPARTITION')
+    WHERE e.segment_name = :table_name
+      AND e.segment_type IN ('TABLE', 'TABLE PARTITION', 'TABLE SUBPARTITION')
+      AND NOT EXISTS (
+          SELECT 1 FROM user_extents be
+          JOIN user_tablespaces t ON t.tablespace_name = be.tablespace_name
+          WHERE be.segment_name = :table_name AND t.bigfile = 'YES'
+      )
+)
+GROUP BY grp
+ORDER BY lo
+"""
+
+# "SELECT ... FROM [owner.]table [alias] [WHERE ...]" with a single FROM
+_SINGLE_TABLE_RE = re.compile(
+    r"^\s*SELECT\b.+?\bFROM\s+((?:[A-Za-z][\w$#]*\.)?[A-Za-z][\w$#]*)(?:\s+(?!WHERE\b)[A-Za-z][\w$#]*)?\s*(?:\bWHERE\b.*)?$",
+    re.IGNORECASE | re.DOTALL,
+)
+_NOT_ROWID_SLICEABLE_RE = re.compile(
+    r"\b(JOIN|GROUP\s+BY|DISTINCT|UNIQUE|UNION|INTERSECT|MINUS|CONNECT\s+BY|ROWNUM|FETCH|OFFSET)\b",
+    re.IGNORECASE,
+)
+
+# Markers passed from slice fetch threads to the merging consumer
+_SLICE_DONE = object()
+
+
+class _SliceFailure:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def _single_table(sql: str) -> Optional[str]:
+    """Table scanned by a plain single-table SELECT, or None if the query is anything else."""
+    if len(re.findall(r"\bFROM\b", sql, re.IGNORECASE)) != 1 or _NOT_ROWID_SLICEABLE_RE.search(sql):
+        return None
+    match = _SINGLE_TABLE_RE.match(sql)
+    return match.group(1).upper() if match else None
+
+
+def _null_last_key(positions: Sequence[int]):
+    """Sort key over row positions matching Oracle's default ASC NULLS LAST."""
+    def key(row):
+        return tuple((False, row[pos]) if row[pos] is not None else (True, 0) for pos in positions)
+    return key
+
+
 class DatabaseManager:
     """
     Oracle-backed database manager using oracledb (native Thin mode).
@@ -27,9 +459,8 @@ class DatabaseManager:
         self.password = getattr(settings, "DB_PASSWORD", "")
         self.service_name = getattr(settings, "DB_SERVICE_NAME", "xe")
 
-        pool_min = int(getattr(settings, "DB_POOL_MIN", 2))
-        pool_max = int(getattr(settings, "DB_POOL_MAX", 10))
-        pool_inc = int(getattr(settings, "DB_POOL_INC", 1))
+        self.pools: Dict[str, Any] = {}
+        self.metrics: Dict[str, PoolMetrics] = {name: PoolMetrics(name) for name in WORKLOADS}
 
         # Enable Thick mode if Oracle Client libraries are available (needed for 11g sometimes?)
         # For 'oracledb', Thin mode works with 12c+. For 11g, Thick mode might be required.
@@ -44,29 +475,56 @@ class DatabaseManager:
 
         dsn = oracledb.makedsn(self.host, self.port, service_name=self.service_name)
         
-        try:
-            self.pool = oracledb.create_pool(
-                user=self.user,
-                password=self.password,
-                dsn=dsn,
-                min=pool_min,
-                max=pool_max,
-                increment=pool_inc
-            )
-            logger.info(
-                f"Oracle connection pool created successfully (dsn={dsn})"
-            )
-        except Exception as exc:
-            logger.error(f"Failed to create Oracle connection pool: {exc}")
-            self.pool = None
+        for workload in WORKLOADS:
+            try:
+                self.pools[workload] = oracledb.create_pool(
+                    user=self.user,
+                    password=self.password,
+                    dsn=dsn,
+                    session_callback=self.metrics[workload].session_callback,
+                    **_pool_options(workload),
+                )
+                logger.info(
+                    f"Oracle connection pool '{workload}' created successfully (dsn={dsn})"
+                )
+            except Exception as exc:
+                logger.error(f"Failed to create Oracle connection pool '{workload}': {exc}")
+
+    @property
+    def pool(self):
+        """The interactive pool (kept for callers that predate named pools)."""
+        return self.pools.get(WORKLOAD_INTERACTIVE)
+
+    def _resolve_pool(self, workload: str) -> Tuple[str, Any]:
+        """Pool serving ``workload``, falling back to the interactive pool if it failed to open."""
+        if workload not in WORKLOADS:
+            raise ValueError(f"Unknown workload class: {workload}")
+        pool = self.pools.get(workload)
+        if pool is None and workload != WORKLOAD_INTERACTIVE:
+            workload, pool = WORKLOAD_INTERACTIVE, self.pools.get(WORKLOAD_INTERACTIVE)
+        return workload, pool
 
     @contextmanager
-    def get_connection(self):
-        """Get database connection from pool with proper cleanup."""
+    def get_connection(self, timeout: Optional[float] = None, workload: str = WORKLOAD_INTERACTIVE):
+        """Get database connection from the workload's pool with proper cleanup.
+
+        With a positive ``timeout`` (seconds) every round trip made inside the
+        block is bounded by ``call_timeout`` and the shared watchdog thread
+        calls ``conn.cancel()`` once the overall deadline passes, so long
+        fetches spanning many round trips are broken off on the server as
+        well. Either way the caller gets a QueryTimeoutError. ``0``/``None``
+        means no limit (used by exports). The connection is only discarded
+        when the cancel interrupted the block; one landing after the work
+        finished leaves it to the usual health check.
+        """
+        workload, pool = self._resolve_pool(workload)
+        metrics = self.metrics[workload]
         conn = None
+        deadline = None
+        interrupted = False
         try:
-            if self.pool:
-                conn = self.pool.acquire()
+            if pool:
+                conn = self._acquire(pool, metrics)
             else:
                 dsn = oracledb.makedsn(self.host, self.port, service_name=self.service_name)
                 conn = oracledb.connect(
@@ -74,32 +532,113 @@ class DatabaseManager:
                     password=self.password,
                     dsn=dsn
                 )
+            if _has_timeout(timeout):
+                conn.call_timeout = int(timeout * 1000)
+                deadline = _call_watchdog.arm(conn, timeout)
             yield conn
         except Exception as exc:
+            interrupted = deadline is not None and deadline.disarm()
+            if _has_timeout(timeout) and (interrupted or _is_timeout_error(exc)):
+                logger.warning(f"Query cancelled after exceeding {timeout}s timeout: {exc}")
+                raise QueryTimeoutError(f"Query exceeded the {timeout}s timeout and was cancelled") from exc
             logger.error(f"Database connection error: {exc}")
             raise
         finally:
+            if deadline is not None:
+                deadline.disarm()
             if conn:
-                try:
-                    if self.pool:
-                        self.pool.release(conn)
-                    else:
-                        conn.close()
-                except Exception as exc:
-                    logger.error(f"Error closing Oracle connection: {exc}")
+                self._release(conn, pool, metrics, discard=interrupted)
 
-    def execute_query(
-        self, query: str, params: ParamType = None, fetch_size: int = 10000, timeout: int = 45
-    ) -> List[Dict[str, Any]]:
-        """Execute query and return results as list of dictionaries"""
+    @staticmethod
+    def _acquire(pool, metrics: PoolMetrics):
+        """Acquire from the pool, recording the wait and failing fast when saturated."""
+        start = time.perf_counter()
+        try:
+            conn = pool.acquire()
+        except oracledb.Error as exc:
+            waited = time.perf_counter() - start
+            if "DPY-4005" in str(exc):
+                metrics.record_acquire_timeout(waited)
+                logger.warning(
+                    f"Connection pool '{metrics.name}' exhausted, gave up after {waited:.2f}s "
+                    f"(busy={pool.busy}, max={pool.max})"
+                )
+                raise PoolTimeoutError(
+                    f"No database connection available within {waited:.1f}s; the server is busy, please retry"
+                ) from exc
+            metrics.record_acquire_error(waited)
+            raise
+        metrics.record_acquire(time.perf_counter() - start)
+        return conn
+
+    def ping(self, workload: str = WORKLOAD_META) -> float:
+        """Round-trip ping on a pooled connection; returns the latency in seconds."""
+        workload, _ = self._resolve_pool(workload)
+        metrics = self.metrics[workload]
+        with self.get_connection(workload=workload) as conn:
+            start = time.perf_counter()
+            try:
+                conn.ping()
+            except Exception:
+                metrics.record_ping(ok=False)
+                raise
+            metrics.record_ping(ok=True)
+            return time.perf_counter() - start
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Gauges and counters of every named pool without a database round trip."""
+        return {name: self.metrics[name].snapshot(self.pools.get(name)) for name in WORKLOADS}
+
+    @staticmethod
+    def _release(conn, pool, metrics: PoolMetrics, discard: bool = False) -> None:
+        """Return a connection to its pool, dropping it if it may be unusable.
+
+        A connection that was cancelled or hit ``call_timeout`` can be left
+        mid-protocol; it is closed instead of being handed to the next caller.
+        """
+        try:
+            if pool:
+                if discard or not conn.is_healthy():
+                    pool.drop(conn)
+                    metrics.record_dropped()
+                    logger.warning(f"Dropped unhealthy Oracle connection from pool '{metrics.name}'")
+                else:
+                    conn.call_timeout = 0
+                    pool.release(conn)
+            else:
+                conn.close()
+        except Exception as exc:
+            logger.error(f"Error closing Oracle connection: {exc}")
+
+    @staticmethod
+    def _configure_cursor(cursor, fetch_size: int) -> None:
+        """Size the fetch buffers before execute.
+
+        ``prefetchrows`` rows come back on the execute round trip itself and
+        ``arraysize`` rows on every following fetch round trip.
+        """
+        if fetch_size and fetch_size > 0:
+            cursor.arraysize = fetch_size
+            cursor.prefetchrows = fetch_size
+
+    def execute_query_rows(
+        self,
+        query: str,
+        params: ParamType = None,
+        fetch_size: int = 1000,
+        timeout: int = 45,
+        workload: str = WORKLOAD_INTERACTIVE,
+    ) -> ResultSet:
+        """Execute query and return column names once plus rows as tuples"""
         start_time = time.time()
         
         try:
             # Clean up SQL for Oracle (remove trailing semicolons)
             sql = query.strip().rstrip(';')
             
-            with self.get_connection() as conn:
+            with self.get_connection(timeout=timeout, workload=workload) as conn:
                 cursor = conn.cursor()
+                self._configure_cursor(cursor, fetch_size)
                 
                 # Handling named vs positional parameters
                 # oracledb supports dict for named (:name) and sequence for positional (:1)
@@ -107,32 +646,46 @@ class DatabaseManager:
                 cursor.execute(sql, params or {})
                 
                 if cursor.description:
-                    columns = [col[0] for col in cursor.description]
-                    cursor.rowfactory = lambda *args: dict(zip(columns, args))
-                    
-                    # Fetch results
-                    results = cursor.fetchall() 
-                    # Fetchall is usually fine for reasonable fetch_sizes, or use fetchmany loop
+                    result = ResultSet([col[0] for col in cursor.description], cursor.fetchall())
                 else:
-                    results = []
+                    result = ResultSet([], [])
 
                 execution_time = time.time() - start_time
-                logger.info(f"Query executed successfully in {execution_time:.2f}s, returned {len(results)} rows")
-                return results
+                logger.info(f"Query executed successfully in {execution_time:.2f}s, returned {len(result)} rows")
+                return result
 
         except Exception as e:
             execution_time = time.time() - start_time
             logger.error(f"Query execution error after {execution_time:.2f}s: {e}")
             raise
 
-    def execute_query_pandas(self, query: str, params: ParamType = None, timeout: int = 45) -> pd.DataFrame:
+    def execute_query(
+        self,
+        query: str,
+        params: ParamType = None,
+        fetch_size: int = 1000,
+        timeout: int = 45,
+        workload: str = WORKLOAD_INTERACTIVE,
+    ) -> List[Dict[str, Any]]:
+        """Execute query and return results as list of dictionaries.
+
+        Compatibility wrapper over ``execute_query_rows``; new code should use
+        that directly to avoid allocating a dict per row.
+        """
+        return self.execute_query_rows(
+            query, params, fetch_size=fetch_size, timeout=timeout, workload=workload
+        ).as_dicts()
+
+    def execute_query_pandas(
+        self, query: str, params: ParamType = None, timeout: int = 45, workload: str = WORKLOAD_INTERACTIVE
+    ) -> pd.DataFrame:
         """Execute query and return pandas DataFrame"""
         start_time = time.time()
         
         try:
             sql = query.strip().rstrip(';')
             
-            with self.get_connection() as conn:
+            with self.get_connection(timeout=timeout, workload=workload) as conn:
                 # pandas read_sql supports sqlalchemy engine or DBAPI2 connection
                 # passing conn directly works with oracledb
                 df = pd.read_sql(sql, conn, params=params or {})
@@ -147,11 +700,386 @@ class DatabaseManager:
             # oracledb/pandas interaction might fail if columns are unknown on "WHERE 1=0"
             raise
 
-    def execute_non_query(self, query: str, params: ParamType = None) -> int:
+    def execute_query_arrow(
+        self,
+        query: str,
+        params: ParamType = None,
+        fetch_size: int = 10000,
+        timeout: int = 45,
+        workload: str = WORKLOAD_INTERACTIVE,
+    ) -> pa.Table:
+        """Execute query and return a pyarrow Table.
+
+        Uses the driver's data frame fetch (``fetch_df_all``) which decodes rows
+        straight into Arrow column buffers, so no per-row Python tuples are
+        built. Call ``.to_pandas()`` on the result for a DataFrame. Falls back
+        to ``execute_query_pandas`` for column types the driver cannot convert.
+        """
+        start_time = time.time()
+
+        try:
+            sql = query.strip().rstrip(';')
+
+            with self.get_connection(timeout=timeout, workload=workload) as conn:
+                odf = conn.fetch_df_all(statement=sql, parameters=params or {}, arraysize=fetch_size)
+                table = pa.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+
+            execution_time = time.time() - start_time
+            logger.info(
+                f"Arrow table created in {execution_time:.2f}s with {table.num_rows} rows, {table.num_columns} columns"
+            )
+            return table
+
+        except oracledb.NotSupportedError as e:
+            logger.warning(f"Columnar fetch not supported for this query, falling back to pandas: {e}")
+            df = self.execute_query_pandas(query, params, timeout=timeout, workload=workload)
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except Exception as e:
+            logger.error(f"Arrow query execution error: {e}")
+            raise
+
+    def stream_query(
+        self,
+        query: str,
+        params: ParamType = None,
+        batch_size: int = 5000,
+        timeout: int = 0,
+        workload: str = WORKLOAD_BULK,
+    ) -> Iterator[ResultSet]:
+        """Stream a query as ResultSet chunks of at most ``batch_size`` rows.
+
+        The first chunk carries only the column names and is yielded as soon
+        as the statement has executed, so callers can emit headers before any
+        row is fetched. Rows are then pulled with ``fetchmany``, keeping memory
+        bounded by one chunk. The connection stays checked out until the
+        generator is exhausted or closed.
+        """
+        sql = query.strip().rstrip(';')
+        start_time = time.time()
+        total_rows = 0
+
+        with self.get_connection(timeout=timeout, workload=workload) as conn:
+            cursor = conn.cursor()
+            self._configure_cursor(cursor, batch_size)
+            cursor.execute(sql, params or {})
+            columns = [col[0] for col in cursor.description] if cursor.description else []
+            yield ResultSet(columns, [])
+
+            while columns:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                total_rows += len(rows)
+                yield ResultSet(columns, rows)
+
+        execution_time = time.time() - start_time
+        logger.info(f"Streamed {total_rows} rows in {execution_time:.2f}s")
+
+    def stream_query_arrow(
+        self,
+        query: str,
+        params: ParamType = None,
+        batch_size: int = 50000,
+        timeout: int = 0,
+        workload: str = WORKLOAD_BULK,
+    ) -> Iterator[pa.Table]:
+        """Stream a query as pyarrow Tables of at most ``batch_size`` rows.
+
+        Batches come from the driver's ``fetch_df_batches``, which decodes
+        straight into Arrow buffers; every batch is cast to the schema of the
+        first so writers see one consistent schema. At least one (possibly
+        empty) table is always yielded, typed from the cursor description when
+        the query returns no rows. Column types the data frame fetch cannot
+        convert fall back to a row-wise fetch typed the same way.
+        """
+        sql = query.strip().rstrip(';')
+        start_time = time.time()
+        total_rows = 0
+        schema: Optional[pa.Schema] = None
+
+        with self.get_connection(timeout=timeout, workload=workload) as conn:
+            try:
+                for odf in conn.fetch_df_batches(statement=sql, parameters=params or {}, size=batch_size):
+                    table = pa.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+                    if schema is None:
+                        schema = table.schema
+                    elif table.schema != schema:
+                        table = table.cast(schema)
+                    total_rows += table.num_rows
+                    yield table
+            except oracledb.NotSupportedError as e:
+                if schema is not None:
+                    raise
+                logger.warning(f"Columnar fetch not supported for this query, streaming rows instead: {e}")
+                cursor = conn.cursor()
+                self._configure_cursor(cursor, batch_size)
+                cursor.execute(sql, params or {})
+                schema = _arrow_schema(cursor.description)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    total_rows += len(rows)
+                    yield _rows_to_arrow(rows, schema)
+                if not total_rows:
+                    yield schema.empty_table()
+
+            if schema is None:
+                # No rows, so no batches: describe the query without fetching
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT * FROM ({sql}) empty_src WHERE 1=0", params or {})
+                yield _arrow_schema(cursor.description).empty_table()
+
+        execution_time = time.time() - start_time
+        logger.info(f"Streamed {total_rows} rows as Arrow batches in {execution_time:.2f}s")
+
+    def _rowid_ranges(self, conn, sql: str, params: Dict[str, Any], slices: int, table: Optional[str]) -> List[Tuple[str, str]]:
+        """ROWID ranges splitting ``table`` into ``slices`` parts, or [] if ``sql`` cannot be sliced by ROWID."""
+        table = table or _single_table(sql)
+        if not table:
+            return []
+        owner, _, name = table.upper().rpartition(".")
+        if owner and owner != (conn.username or "").upper():
+            return []
+        cursor = conn.cursor()
+        try:
+            # ROWID must be selectable through the query (single key-preserved table)
+            cursor.execute(f"SELECT ROWID FROM ({sql}) slice_src WHERE 1=0", params)
+            cursor.execute(ROWID_RANGES_SQL, {"slices": slices, "table_name": name})
+            return [(lo, hi) for lo, hi in cursor.fetchall()]
+        except oracledb.DatabaseError as e:
+            logger.info(f"ROWID slicing not available for {table}: {e}")
+            return []
+
+    @staticmethod
+    def _slice_columns(description: Sequence[Any], names: Sequence[str]) -> List[str]:
+        """Quoted identifiers of result columns ``names`` (matched case-insensitively)."""
+        actual = {col[0].upper(): col[0] for col in description}
+        missing = [name for name in names if name.upper() not in actual]
+        if missing:
+            raise ValueError(f"Unknown column(s): {', '.join(missing)}")
+        return ['"' + actual[name.upper()].replace('"', '""') + '"' for name in names]
+
+    @staticmethod
+    def _slice_hash_expr(description: Sequence[Any], partition_by: Optional[Sequence[str]]) -> str:
+        """Expression hashed into slice buckets: ``partition_by`` columns or the first hashable ones."""
+        if partition_by:
+            quoted = DatabaseManager._slice_columns(description, partition_by)
+        else:
+            columns = [col for col in description if col[1] in HASHABLE_DB_TYPES][:SLICE_HASH_MAX_COLUMNS]
+            if not columns:
+                raise ValueError("Query has no columns that can be hashed into slices")
+            quoted = DatabaseManager._slice_columns(description, [col[0] for col in columns])
+        # NVL keeps rows whose key is NULL: ORA_HASH(NULL) is NULL and would match no slice
+        return " + ".join(f"NVL(ORA_HASH({col}), 0)" for col in quoted)
+
+    def _plan_slices(
+        self,
+        sql: str,
+        params: Dict[str, Any],
+        slices: int,
+        strategy: str,
+        table: Optional[str],
+        partition_by: Optional[Sequence[str]],
+        order_by: Optional[Sequence[str]],
+        timeout: int,
+        workload: str,
+    ) -> Tuple[Sequence[Any], List[Tuple[str, Dict[str, Any]]]]:
+        """Describe the query and build one (sql, binds) per slice."""
+        with self.get_connection(timeout=timeout, workload=workload) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT * FROM ({sql}) slice_src WHERE 1=0", params)
+            description = cursor.description
+            order_clause = ""
+            if order_by:
+                order_clause = " ORDER BY " + ", ".join(self._slice_columns(description, order_by))
+
+            if strategy in ("auto", "rowid"):
+                ranges = self._rowid_ranges(conn, sql, params, slices, table)
+                if ranges:
+                    slice_sql = (
+                        f"SELECT * FROM ({sql}) slice_src "
+                        f"WHERE ROWID BETWEEN CHARTOROWID(:ps_lo) AND CHARTOROWID(:ps_hi){order_clause}"
+                    )
+                    logger.info(f"Parallel fetch split by ROWID into {len(ranges)} slices")
+                    return description, [(slice_sql, {**params, "ps_lo": lo, "ps_hi": hi}) for lo, hi in ranges]
+                if strategy == "rowid":
+                    raise ValueError("ROWID slicing needs a plain single-table query on a table in the current schema")
+
+        hash_expr = self._slice_hash_expr(description, partition_by)
+        slice_sql = f"SELECT * FROM ({sql}) slice_src WHERE ORA_HASH({hash_expr}, :ps_buckets) = :ps_slice{order_clause}"
+        logger.info(f"Parallel fetch split by ORA_HASH into {slices} slices")
+        return description, [
+            (slice_sql, {**params, "ps_buckets": slices - 1, "ps_slice": idx}) for idx in range(slices)
+        ]
+
+    @staticmethod
+    def _offer(out: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+        """Put ``item`` unless the consumer has stopped; returns False once stopped."""
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fetch_slice(self, source: Iterator, out: "queue.Queue", stop: threading.Event) -> None:
+        """Thread body: push one slice's chunks to ``out``, then a done or failure marker."""
+        try:
+            try:
+                for chunk in source:
+                    if not self._offer(out, chunk, stop):
+                        return
+            finally:
+                source.close()
+            self._offer(out, _SLICE_DONE, stop)
+        except BaseException as exc:
+            self._offer(out, _SliceFailure(exc), stop)
+
+    def stream_query_parallel(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        slices: int = 4,
+        strategy: str = "auto",
+        table: Optional[str] = None,
+        partition_by: Optional[Sequence[str]] = None,
+        order_by: Optional[Sequence[str]] = None,
+        arrow: bool = False,
+        batch_size: int = 5000,
+        timeout: int = 0,
+        workload: str = WORKLOAD_BULK,
+    ) -> Iterator[Any]:
+        """Fetch a query as ``slices`` disjoint slices on separate pooled connections.
+
+        Yields what ``stream_query`` yields (a columns-only ResultSet, then row
+        chunks), or with ``arrow`` what ``stream_query_arrow`` yields, so
+        callers can switch between serial and parallel fetch.
+
+        Slicing strategies:
+
+        * ``rowid`` - plain single-table queries on a table in the current
+          schema are cut into ROWID ranges over the table's extents, so each
+          slice scans only its own blocks. ``table`` names the table when it
+          cannot be read from the query.
+        * ``hash`` - any other query is wrapped once per slice and filtered on
+          ``ORA_HASH`` of the ``partition_by`` columns (default: the first
+          hashable columns). Every slice runs the full query, so this
+          parallelises transfer and decoding rather than the scan itself.
+        * ``auto`` - ROWID ranges when possible, hash otherwise.
+
+        Without ``order_by`` chunks are yielded as slices produce them (no
+        ordering). With ``order_by`` each slice is sorted on those columns
+        and the slices are merged in order (row mode only). The query must be
+        deterministic and use named binds; slices run in separate sessions,
+        so concurrent changes to the data can be seen by some slices and not
+        others. ``slices`` is capped at the workload's pool size.
+        """
+        sql = query.strip().rstrip(';')
+        if params and not isinstance(params, dict):
+            raise ValueError("Parallel fetch needs named binds")
+        params = dict(params or {})
+        if strategy not in SLICE_STRATEGIES:
+            raise ValueError(f"Unknown slice strategy: {strategy}")
+        if order_by and arrow:
+            raise ValueError("Ordered parallel fetch is only available for row chunks")
+        # Only as many slices as the pool can serve right now: an ordered merge
+        # would otherwise wait on a slice that cannot get a connection.
+        _, pool = self._resolve_pool(workload)
+        slices = max(1, min(slices, pool.max - pool.busy if pool is not None else 1))
+        if slices == 1:
+            if arrow:
+                yield from self.stream_query_arrow(sql, params, timeout=timeout, workload=workload)
+            else:
+                yield from self.stream_query(sql, params, batch_size=batch_size, timeout=timeout, workload=workload)
+            return
+
+        description, plan = self._plan_slices(
+            sql, params, slices, strategy, table, partition_by, order_by, timeout, workload
+        )
+        columns = [col[0] for col in description]
+        start_time = time.time()
+        total_rows = 0
+
+        stop = threading.Event()
+        ordered = bool(order_by)
+        # Ordered merges need one queue per slice; otherwise slices share one
+        queues = [queue.Queue(maxsize=2) for _ in plan] if ordered else [queue.Queue(maxsize=2 * len(plan))]
+        threads = []
+        for idx, (slice_sql, binds) in enumerate(plan):
+            if arrow:
+                source = self.stream_query_arrow(slice_sql, binds, timeout=timeout, workload=workload)
+            else:
+                source = self.stream_query(slice_sql, binds, batch_size=batch_size, timeout=timeout, workload=workload)
+            out = queues[idx] if ordered else queues[0]
+            thread = threading.Thread(
+                target=self._fetch_slice, args=(source, out, stop), name=f"parallel-fetch-{idx}", daemon=True
+            )
+            threads.append(thread)
+
+        def slice_chunks(out: "queue.Queue", expected: int) -> Iterator[Any]:
+            done = 0
+            while done < expected:
+                item = out.get()
+                if item is _SLICE_DONE:
+                    done += 1
+                elif isinstance(item, _SliceFailure):
+                    raise item.exc
+                else:
+                    yield item
+
+        try:
+            for thread in threads:
+                thread.start()
+
+            if arrow:
+                schema = None
+                for table_chunk in slice_chunks(queues[0], len(plan)):
+                    if not table_chunk.num_rows:
+                        continue
+                    if schema is None:
+                        schema = table_chunk.schema
+                    elif table_chunk.schema != schema:
+                        table_chunk = table_chunk.cast(schema)
+                    total_rows += table_chunk.num_rows
+                    yield table_chunk
+                if schema is None:
+                    yield _arrow_schema(description).empty_table()
+            else:
+                yield ResultSet(columns, [])
+                if ordered:
+                    positions = [{name.upper(): pos for pos, name in enumerate(columns)}[name.upper()] for name in order_by]
+                    streams = [(row for chunk in slice_chunks(out, 1) for row in chunk.rows) for out in queues]
+                    batch: List[tuple] = []
+                    for row in heapq.merge(*streams, key=_null_last_key(positions)):
+                        batch.append(row)
+                        if len(batch) >= batch_size:
+                            total_rows += len(batch)
+                            yield ResultSet(columns, batch)
+                            batch = []
+                    if batch:
+                        total_rows += len(batch)
+                        yield ResultSet(columns, batch)
+                else:
+                    for chunk in slice_chunks(queues[0], len(plan)):
+                        if chunk.rows:
+                            total_rows += len(chunk.rows)
+                            yield chunk
+        finally:
+            stop.set()
+            for thread in threads:
+                if thread.is_alive():
+                    thread.join()
+
+        execution_time = time.time() - start_time
+        logger.info(f"Parallel fetch of {total_rows} rows over {len(plan)} slices in {execution_time:.2f}s")
+
+    def execute_non_query(self, query: str, params: ParamType = None, workload: str = WORKLOAD_INTERACTIVE) -> int:
         """Execute non-query (UPDATE, DELETE) and return affected rows"""
         try:
             sql = query.strip().rstrip(';')
-            with self.get_connection() as conn:
+            with self.get_connection(workload=workload) as conn:
                 cursor = conn.cursor()
                 cursor.execute(sql, params or {})
                 affected_rows = cursor.rowcount
@@ -162,14 +1090,16 @@ class DatabaseManager:
             logger.error(f"Non-query execution error: {e}")
             raise
 
-    def execute_insert(self, query: str, params: ParamType = None) -> Tuple[int, Optional[int]]:
+    def execute_insert(
+        self, query: str, params: ParamType = None, workload: str = WORKLOAD_INTERACTIVE
+    ) -> Tuple[int, Optional[int]]:
         """
         Execute INSERT and try to return (affected_rows, last_insert_id).
         Uses 'RETURNING id INTO :out_id' pattern for Oracle.
         """
         try:
             sql = query.strip().rstrip(';')
-            with self.get_connection() as conn:
+            with self.get_connection(workload=workload) as conn:
                 cursor = conn.cursor()
                 
                 # Check if we can automatically append RETURNING clause
@@ -223,9 +1153,482 @@ class DatabaseManager:
             logger.error(f"Insert execution error: {e}")
             raise
 
+    def execute_many(
+        self,
+        statement: str,
+        rows: Sequence[ParamType],
+        batch_size: int = 1000,
+        batch_errors: bool = False,
+        commit_per_batch: bool = False,
+        timeout: int = 0,
+        workload: str = WORKLOAD_INTERACTIVE,
+        commit_before_error: bool = False,
+    ) -> ExecuteManyResult:
+        """Execute one DML statement for many bind rows using array binding.
+
+        Rows are sent ``batch_size`` at a time, one round trip per batch, on a
+        single connection. With ``batch_errors`` rejected rows are collected
+        in ``result.errors`` (offsets index into ``rows``) instead of failing
+        the call; otherwise the first error rolls back the uncommitted work
+        and is raised as BatchExecutionError carrying the failing row offset.
+        ``commit_per_batch`` commits after every batch instead of once at the
+        end of the call. ``commit_before_error`` commits the rows before the
+        failing one instead of rolling them back; the error's
+        ``result.rowcount`` then counts them (one row each, as for
+        ``INSERT ... VALUES``).
+        """
+        result = ExecuteManyResult()
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        if not rows:
+            return result
+        sql = statement.strip().rstrip(';')
+        batch_size = max(int(batch_size or 1), 1)
+        input_sizes = _infer_input_sizes(rows)
+        start_time = time.time()
+
+        try:
+            with self.get_connection(timeout=timeout, workload=workload) as conn:
+                cursor = conn.cursor()
+                batch_start = 0
+                try:
+                    for batch_start in range(0, len(rows), batch_size):
+                        batch = rows[batch_start:batch_start + batch_size]
+                        if input_sizes:
+                            cursor.setinputsizes(*input_sizes)
+                        cursor.executemany(sql, batch, batcherrors=batch_errors)
+                        result.batches += 1
+                        result.rowcount += cursor.rowcount
+                        if batch_errors:
+                            result.add_batch_errors(cursor.getbatcherrors(), batch_start)
+                        if commit_per_batch:
+                            conn.commit()
+                    if not commit_per_batch:
+                        conn.commit()
+                except Exception as exc:
+                    failure = self._batch_failure(exc, batch_start, result, commit_per_batch, commit_before_error)
+                    if commit_before_error and failure.offset is not None:
+                        conn.commit()
+                    else:
+                        conn.rollback()
+                    raise failure from exc
+
+            execution_time = time.time() - start_time
+            logger.info(
+                f"executemany wrote {result.rowcount} rows in {result.batches} batches "
+                f"({len(result.errors)} rejected) in {execution_time:.2f}s"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"Batch execution error: {e}")
+            raise
+
+    @staticmethod
+    def _batch_failure(
+        exc: Exception,
+        batch_start: int,
+        result: ExecuteManyResult,
+        commit_per_batch: bool,
+        commit_before_error: bool = False,
+    ) -> BatchExecutionError:
+        """Wrap a failed executemany with the absolute row offset and what stayed committed."""
+        error_obj = exc.args[0] if isinstance(exc, oracledb.Error) and exc.args else None
+        offset = getattr(error_obj, "offset", None)
+        if commit_before_error and offset is not None:
+            # Rows of the failing batch before ``offset`` were executed and will be committed
+            result.rowcount += offset
+        elif not commit_per_batch:
+            result.rowcount = 0
+            result.errors = []
+        return BatchExecutionError(str(exc), batch_start + offset if offset is not None else None, result)
+
+
+class AsyncDatabaseManager:
+    """
+    asyncio counterpart of DatabaseManager built on oracledb's async pool.
+
+    python-oracledb only implements asyncio in Thin mode. When DatabaseManager
+    enabled Thick mode (Oracle Client libraries found), every call is handed to
+    the synchronous manager on a worker thread instead, so callers can always
+    ``await`` these methods without stalling the event loop.
+    """
+
+    def __init__(self, sync_manager: DatabaseManager):
+        self.sync_manager = sync_manager
+        self.native = oracledb.is_thin_mode()
+        self.pools: Dict[str, Any] = {}
+        self._opened = False
+        self._pool_lock: Optional[asyncio.Lock] = None
+        self.metrics: Dict[str, PoolMetrics] = {name: PoolMetrics(f"async_{name}") for name in WORKLOADS}
+
+    @property
+    def pool(self):
+        """The interactive asyncio pool (kept for callers that predate named pools)."""
+        return self.pools.get(WORKLOAD_INTERACTIVE)
+
+    async def open(self) -> None:
+        """Create the named asyncio pools. Must be called from a running event loop."""
+        if not self.native or self._opened:
+            return
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if self._opened:
+                return
+            manager = self.sync_manager
+            dsn = oracledb.makedsn(manager.host, manager.port, service_name=manager.service_name)
+            for workload in WORKLOADS:
+                try:
+                    self.pools[workload] = oracledb.create_pool_async(
+                        user=manager.user,
+                        password=manager.password,
+                        dsn=dsn,
+                        session_callback=self.metrics[workload].async_session_callback,
+                        **_pool_options(workload),
+                    )
+                    logger.info(f"Oracle asyncio connection pool '{workload}' created successfully (dsn={dsn})")
+                except Exception as exc:
+                    logger.error(f"Failed to create Oracle asyncio connection pool '{workload}': {exc}")
+            if WORKLOAD_INTERACTIVE not in self.pools:
+                logger.error("Interactive asyncio pool unavailable, using worker threads")
+                await self.close()
+                self.native = False
+            self._opened = True
+
+    async def close(self) -> None:
+        pools, self.pools = self.pools, {}
+        self._opened = False
+        for name, pool in pools.items():
+            try:
+                await pool.close(force=True)
+            except Exception as exc:
+                logger.error(f"Error closing Oracle asyncio connection pool '{name}': {exc}")
+
+    def _resolve_pool(self, workload: str) -> Tuple[str, Any]:
+        """Same routing as DatabaseManager._resolve_pool over the asyncio pools."""
+        if workload not in WORKLOADS:
+            raise ValueError(f"Unknown workload class: {workload}")
+        pool = self.pools.get(workload)
+        if pool is None:
+            workload, pool = WORKLOAD_INTERACTIVE, self.pools.get(WORKLOAD_INTERACTIVE)
+        return workload, pool
+
+    @asynccontextmanager
+    async def get_connection(self, timeout: Optional[float] = None, workload: str = WORKLOAD_INTERACTIVE):
+        """Get an asyncio database connection from the workload's pool with proper cleanup.
+
+        ``timeout`` behaves as in DatabaseManager.get_connection: each round
+        trip is bounded by ``call_timeout`` (the driver breaks the call off on
+        the server) and the whole block by an asyncio deadline. A connection
+        interrupted either way has its call cancelled and is dropped from the
+        pool, not released.
+        """
+        await self.open()
+        workload, pool = self._resolve_pool(workload)
+        metrics = self.metrics[workload]
+        conn = None
+        discard = False
+        try:
+            conn = await self._acquire(pool, metrics)
+            if _has_timeout(timeout):
+                conn.call_timeout = int(timeout * 1000)
+                async with asyncio.timeout(timeout):
+                    yield conn
+            else:
+                yield conn
+        except PoolTimeoutError:
+            raise
+        except Exception as exc:
+            if _has_timeout(timeout) and (isinstance(exc, TimeoutError) or _is_timeout_error(exc)):
+                discard = True
+                logger.warning(f"Async query cancelled after exceeding {timeout}s timeout: {exc!r}")
+                raise QueryTimeoutError(f"Query exceeded the {timeout}s timeout and was cancelled") from exc
+            logger.error(f"Database connection error: {exc}")
+            raise
+        except asyncio.CancelledError:
+            # The request went away mid-call; the protocol state is unknown
+            discard = True
+            raise
+        finally:
+            if conn:
+                if discard:
+                    # The deadline may have fired between round trips or with a
+                    # call still running on the server; break it off before dropping
+                    try:
+                        conn.cancel()
+                    except Exception as exc:
+                        logger.error(f"Error cancelling timed out Oracle call: {exc}")
+                try:
+                    if discard or not conn.is_healthy():
+                        await pool.drop(conn)
+                        metrics.record_dropped()
+                        logger.warning(f"Dropped unhealthy Oracle connection from asyncio pool '{workload}'")
+                    else:
+                        conn.call_timeout = 0
+                        await pool.release(conn)
+                except Exception as exc:
+                    logger.error(f"Error releasing Oracle connection: {exc}")
+
+    @staticmethod
+    async def _acquire(pool, metrics: PoolMetrics):
+        """Async counterpart of DatabaseManager._acquire."""
+        start = time.perf_counter()
+        try:
+            conn = await pool.acquire()
+        except oracledb.Error as exc:
+            waited = time.perf_counter() - start
+            if "DPY-4005" in str(exc):
+                metrics.record_acquire_timeout(waited)
+                logger.warning(f"Asyncio connection pool '{metrics.name}' exhausted, gave up after {waited:.2f}s")
+                raise PoolTimeoutError(
+                    f"No database connection available within {waited:.1f}s; the server is busy, please retry"
+                ) from exc
+            metrics.record_acquire_error(waited)
+            raise
+        metrics.record_acquire(time.perf_counter() - start)
+        return conn
+
+    def pool_stats(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Gauges and counters of the asyncio pools (None when using worker threads)."""
+        if not self.native:
+            return None
+        return {name: self.metrics[name].snapshot(self.pools.get(name)) for name in WORKLOADS}
+
+    async def _run_sync(self, func, *args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def execute_query_rows(
+        self,
+        query: str,
+        params: ParamType = None,
+        fetch_size: int = 1000,
+        timeout: int = 45,
+        workload: str = WORKLOAD_INTERACTIVE,
+    ) -> ResultSet:
+        """Execute query and return column names once plus rows as tuples"""
+        await self.open()
+        if not self.native:
+            return await self._run_sync(
+                self.sync_manager.execute_query_rows,
+                query, params, fetch_size=fetch_size, timeout=timeout, workload=workload,
+            )
+
+        start_time = time.time()
+        try:
+            sql = query.strip().rstrip(';')
+            async with self.get_connection(timeout=timeout, workload=workload) as conn:
+                cursor = conn.cursor()
+                DatabaseManager._configure_cursor(cursor, fetch_size)
+                await cursor.execute(sql, params or {})
+
+                if cursor.description:
+                    result = ResultSet([col[0] for col in cursor.description], await cursor.fetchall())
+                else:
+                    result = ResultSet([], [])
+
+                execution_time = time.time() - start_time
+                logger.info(f"Async query executed successfully in {execution_time:.2f}s, returned {len(result)} rows")
+                return result
+
+        except Exception as e:
+            execution_time = time.time() - start_time
+            logger.error(f"Async query execution error after {execution_time:.2f}s: {e}")
+            raise
+
+    async def execute_query(
+        self,
+        query: str,
+        params: ParamType = None,
+        fetch_size: int = 1000,
+        timeout: int = 45,
+        workload: str = WORKLOAD_INTERACTIVE,
+    ) -> List[Dict[str, Any]]:
+        """Execute query and return results as list of dictionaries (see execute_query_rows)"""
+        result = await self.execute_query_rows(query, params, fetch_size=fetch_size, timeout=timeout, workload=workload)
+        return result.as_dicts()
+
+    async def execute_query_pandas(
+        self, query: str, params: ParamType = None, timeout: int = 45, workload: str = WORKLOAD_INTERACTIVE
+    ) -> pd.DataFrame:
+        """Execute query and return pandas DataFrame"""
+        await self.open()
+        if not self.native:
+            return await self._run_sync(
+                self.sync_manager.execute_query_pandas, query, params, timeout=timeout, workload=workload
+            )
+
+        try:
+            sql = query.strip().rstrip(';')
+            async with self.get_connection(timeout=timeout, workload=workload) as conn:
+                cursor = conn.cursor()
+                await cursor.execute(sql, params or {})
+                columns = [col[0] for col in cursor.description] if cursor.description else []
+                rows = await cursor.fetchall() if cursor.description else []
+
+                df = pd.DataFrame.from_records(rows, columns=columns)
+                logger.info(f"DataFrame created with {len(df)} rows, {len(df.columns)} columns")
+                return df
+
+        except Exception as e:
+            logger.error(f"Async pandas query execution error: {e}")
+            raise
+
+    async def execute_query_arrow(
+        self,
+        query: str,
+        params: ParamType = None,
+        fetch_size: int = 10000,
+        timeout: int = 45,
+        workload: str = WORKLOAD_INTERACTIVE,
+    ) -> pa.Table:
+        """Execute query and return a pyarrow Table (see DatabaseManager.execute_query_arrow)"""
+        await self.open()
+        if not self.native:
+            return await self._run_sync(
+                self.sync_manager.execute_query_arrow,
+                query, params, fetch_size=fetch_size, timeout=timeout, workload=workload,
+            )
+
+        try:
+            sql = query.strip().rstrip(';')
+            async with self.get_connection(timeout=timeout, workload=workload) as conn:
+                odf = await conn.fetch_df_all(statement=sql, parameters=params or {}, arraysize=fetch_size)
+                table = pa.Table.from_arrays(odf.column_arrays(), names=odf.column_names())
+
+            logger.info(f"Arrow table created with {table.num_rows} rows, {table.num_columns} columns")
+            return table
+
+        except oracledb.NotSupportedError as e:
+            logger.warning(f"Columnar fetch not supported for this query, falling back to pandas: {e}")
+            df = await self.execute_query_pandas(query, params, timeout=timeout, workload=workload)
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except Exception as e:
+            logger.error(f"Async arrow query execution error: {e}")
+            raise
+
+    async def execute_non_query(self, query: str, params: ParamType = None, workload: str = WORKLOAD_INTERACTIVE) -> int:
+        """Execute non-query (UPDATE, DELETE) and return affected rows"""
+        await self.open()
+        if not self.native:
+            return await self._run_sync(self.sync_manager.execute_non_query, query, params, workload=workload)
+
+        try:
+            sql = query.strip().rstrip(';')
+            async with self.get_connection(workload=workload) as conn:
+                cursor = conn.cursor()
+                await cursor.execute(sql, params or {})
+                affected_rows = cursor.rowcount
+                await conn.commit()
+                return affected_rows
+
+        except Exception as e:
+            logger.error(f"Async non-query execution error: {e}")
+            raise
+
+    async def execute_insert(
+        self, query: str, params: ParamType = None, workload: str = WORKLOAD_INTERACTIVE
+    ) -> Tuple[int, Optional[int]]:
+        """
+        Execute INSERT and try to return (affected_rows, last_insert_id).
+        Mirrors DatabaseManager.execute_insert (RETURNING id INTO :out_id).
+        """
+        await self.open()
+        if not self.native:
+            return await self._run_sync(self.sync_manager.execute_insert, query, params, workload=workload)
+
+        try:
+            sql = query.strip().rstrip(';')
+            async with self.get_connection(workload=workload) as conn:
+                cursor = conn.cursor()
+                last_id = None
+
+                if "RETURNING" not in sql.upper() and "INSERT INTO" in sql.upper() and not isinstance(params, (list, tuple)):
+                    params_dict = params.copy() if isinstance(params, dict) else {}
+                    out_id_var = cursor.var(oracledb.NUMBER)
+                    params_dict["last_insert_id_out"] = out_id_var
+
+                    await cursor.execute(sql + " RETURNING id INTO :last_insert_id_out", params_dict)
+                    last_id = out_id_var.getvalue()
+                    if isinstance(last_id, list) and len(last_id) > 0:
+                        last_id = last_id[0]
+                else:
+                    # Positional binds or explicit RETURNING: no automatic ID
+                    await cursor.execute(sql, params or {})
+
+                affected_rows = cursor.rowcount
+                await conn.commit()
+                return affected_rows, last_id
+
+        except Exception as e:
+            logger.error(f"Async insert execution error: {e}")
+            raise
+
+    async def execute_many(
+        self,
+        statement: str,
+        rows: Sequence[ParamType],
+        batch_size: int = 1000,
+        batch_errors: bool = False,
+        commit_per_batch: bool = False,
+        timeout: int = 0,
+        workload: str = WORKLOAD_INTERACTIVE,
+        commit_before_error: bool = False,
+    ) -> ExecuteManyResult:
+        """Execute one DML statement for many bind rows (see DatabaseManager.execute_many)"""
+        await self.open()
+        if not self.native:
+            return await self._run_sync(
+                self.sync_manager.execute_many,
+                statement, rows, batch_size=batch_size, batch_errors=batch_errors,
+                commit_per_batch=commit_per_batch, timeout=timeout, workload=workload,
+                commit_before_error=commit_before_error,
+            )
+
+        result = ExecuteManyResult()
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        if not rows:
+            return result
+        sql = statement.strip().rstrip(';')
+        batch_size = max(int(batch_size or 1), 1)
+        input_sizes = _infer_input_sizes(rows)
+
+        try:
+            async with self.get_connection(timeout=timeout, workload=workload) as conn:
+                cursor = conn.cursor()
+                batch_start = 0
+                try:
+                    for batch_start in range(0, len(rows), batch_size):
+                        batch = rows[batch_start:batch_start + batch_size]
+                        if input_sizes:
+                            cursor.setinputsizes(*input_sizes)
+                        await cursor.executemany(sql, batch, batcherrors=batch_errors)
+                        result.batches += 1
+                        result.rowcount += cursor.rowcount
+                        if batch_errors:
+                            result.add_batch_errors(cursor.getbatcherrors(), batch_start)
+                        if commit_per_batch:
+                            await conn.commit()
+                    if not commit_per_batch:
+                        await conn.commit()
+                except Exception as exc:
+                    failure = DatabaseManager._batch_failure(
+                        exc, batch_start, result, commit_per_batch, commit_before_error
+                    )
+                    if commit_before_error and failure.offset is not None:
+                        await conn.commit()
+                    else:
+                        await conn.rollback()
+                    raise failure from exc
+            return result
+
+        except Exception as e:
+            logger.error(f"Async batch execution error: {e}")
+            raise
+
 
-# Global database manager instance
+# Global database manager instances
 db_manager = DatabaseManager()
+async_db_manager = AsyncDatabaseManager(db_manager)
 
 
 def init_database():
@@ -0,0 +1,258 @@
+"""Background export jobs.
+
+Long exports run on a small worker pool instead of inside the HTTP request.
+Each job streams its query from the bulk connection pool through an
+``ExportService`` writer into a file in the spool directory, publishing rows
+and bytes written as it goes. Finished files stay downloadable for
+``EXPORT_JOB_TTL`` seconds and are then deleted together with the job record
+by a sweeper thread that runs every ``PURGE_INTERVAL`` seconds.
+
+Jobs are kept in process memory; a restart forgets them and the startup
+sweep removes whatever files they left behind.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from services import ExportService
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# <32 hex job id><extension, possibly multi-part like .csv.gz>[.part]
+SPOOL_FILE_RE = re.compile(r"^[0-9a-f]{32}(\.\w+)+$")
+
+# Seconds between sweeps for expired jobs
+PURGE_INTERVAL = 60
+
+
+class ExportJob:
+    """State of one background export, updated by the worker thread."""
+
+    def __init__(
+        self,
+        job_id: str,
+        owner_id: int,
+        fmt: str,
+        filename: str,
+        media_type: str,
+        path: str,
+        partition: Optional[str] = None,
+        partition_rows: Optional[int] = None,
+        parallel_slices: Optional[int] = None,
+    ):
+        self.id = job_id
+        self.owner_id = owner_id
+        self.format = fmt
+        self.filename = filename
+        self.media_type = media_type
+        self.path = path
+        self.status = JOB_QUEUED
+        self.rows_written = 0
+        self.bytes_written = 0
+        self.partition = partition
+        self.partition_rows = partition_rows
+        self.parallel_slices = parallel_slices
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def part_path(self) -> str:
+        """File the writer fills; renamed to ``path`` only once complete."""
+        return self.path + ".part"
+
+    @property
+    def base_name(self) -> str:
+        """Download name without its extension (``.zip`` or the format's, e.g. ``.csv.gz``)."""
+        extension = ".zip" if self.partition == "files" else ExportService.EXPORT_FORMATS[self.format]["extension"]
+        if self.filename.lower().endswith(extension):
+            return self.filename[:-len(extension)]
+        return self.filename
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        return self.finished_at + settings.EXPORT_JOB_TTL if self.finished_at else None
+
+    def current_bytes(self) -> int:
+        if self.status != JOB_RUNNING:
+            return self.bytes_written
+        try:
+            return os.path.getsize(self.part_path)
+        except OSError:
+            return 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "format": self.format,
+            "partition": self.partition,
+            "filename": self.filename,
+            "rows_written": self.rows_written,
+            "bytes_written": self.current_bytes(),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "expires_at": self.expires_at,
+        }
+
+
+class ExportJobManager:
+    """Runs export jobs on a thread pool and owns the spool directory."""
+
+    def __init__(self, spool_dir: str, workers: int):
+        self.spool_dir = spool_dir
+        self.workers = workers
+        self._jobs: Dict[str, ExportJob] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Create the spool directory and remove files left by a previous process."""
+        os.makedirs(self.spool_dir, exist_ok=True)
+        for name in os.listdir(self.spool_dir):
+            # Only touch files named like our own spool files
+            if not SPOOL_FILE_RE.match(name):
+                continue
+            try:
+                os.remove(os.path.join(self.spool_dir, name))
+            except OSError as exc:
+                logger.warning(f"Could not remove stale export file {name}: {exc}")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export")
+        if self._sweeper is None:
+            self._stop.clear()
+            self._sweeper = threading.Thread(target=self._sweep, name="export-sweeper", daemon=True)
+            self._sweeper.start()
+        logger.info(f"Export jobs spooling to {self.spool_dir} with {self.workers} workers")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._sweeper is not None:
+            self._stop.set()
+            self._sweeper = None
+
+    def _sweep(self) -> None:
+        """Purge expired jobs even while nobody submits or polls exports."""
+        while not self._stop.wait(PURGE_INTERVAL):
+            try:
+                self.purge_expired()
+            except Exception as exc:
+                logger.error(f"Export job sweep failed: {exc}")
+
+    def submit(
+        self,
+        sql: str,
+        fmt: str,
+        filename: str,
+        owner_id: int,
+        partition: Optional[str] = None,
+        partition_rows: Optional[int] = None,
+        parallel_slices: Optional[int] = None,
+    ) -> ExportJob:
+        """Queue an export of ``sql`` in ``fmt`` (a key of ``ExportService.EXPORT_FORMATS``).
+
+        ``partition``/``partition_rows`` and ``parallel_slices`` are passed to
+        ``ExportService.write_export``; "files" produces a ZIP of parts.
+        """
+        if self._executor is None:
+            self.start()
+        self.purge_expired()
+
+        spec = ExportService.EXPORT_FORMATS[fmt]
+        extension, media_type = spec["extension"], spec["media_type"]
+        if partition == "files":
+            extension, media_type = ".zip", "application/zip"
+        job_id = uuid.uuid4().hex
+        path = os.path.join(self.spool_dir, job_id + extension)
+        job = ExportJob(
+            job_id, owner_id, fmt, filename, media_type, path, partition, partition_rows, parallel_slices
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, sql)
+        logger.info(f"Queued export job {job.id} ({fmt}) for user {owner_id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        self.purge_expired()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_for(self, owner_id: int) -> List[ExportJob]:
+        self.purge_expired()
+        with self._lock:
+            return [job for job in self._jobs.values() if job.owner_id == owner_id]
+
+    def purge_expired(self) -> None:
+        """Forget finished jobs past their TTL and delete their files."""
+        now = time.time()
+        with self._lock:
+            expired = [job for job in self._jobs.values() if job.expires_at and job.expires_at <= now]
+            for job in expired:
+                del self._jobs[job.id]
+        for job in expired:
+            self._remove_files(job)
+            logger.info(f"Export job {job.id} expired")
+
+    @staticmethod
+    def _remove_files(job: ExportJob) -> None:
+        for path in (job.path, job.part_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning(f"Could not remove export file {path}: {exc}")
+
+    def _run(self, job: ExportJob, sql: str) -> None:
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+
+        def progress(rows: int) -> None:
+            job.rows_written = rows
+
+        try:
+            rows = ExportService.write_export(
+                job.format,
+                sql,
+                job.part_path,
+                progress,
+                partition=job.partition,
+                partition_rows=job.partition_rows,
+                base_name=job.base_name,
+                parallel_slices=job.parallel_slices,
+            )
+            os.replace(job.part_path, job.path)
+            job.rows_written = rows
+            job.bytes_written = os.path.getsize(job.path)
+            job.status = JOB_COMPLETED
+            logger.info(f"Export job {job.id} completed: {rows} rows, {job.bytes_written} bytes")
+        except Exception as exc:
+            logger.error(f"Export job {job.id} failed: {exc}")
+            self._remove_files(job)
+            job.error = "Export failed. Please try again or contact support."
+            job.status = JOB_FAILED
+        finally:
+            job.finished_at = time.time()
+
+
+export_job_manager = ExportJobManager(settings.EXPORT_SPOOL_DIR, settings.EXPORT_JOB_WORKERS)
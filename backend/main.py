@@ -10,8 +10,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from security_middleware import SecurityMiddleware, ContentSecurityPolicyMiddleware, RequestValidationMiddleware
 from config import settings
-from database import init_database
+from database import async_db_manager, init_database
+from dashboard_live import dashboard_live_hub
+from export_jobs import export_job_manager
+from snapshots import snapshot_refresher
 from routers.auth import router as auth_router
+from routers.bootstrap import router as bootstrap_router
 from routers.dashboard import router as dashboard_router
 from routers.query import router as query_router
 from routers.admin import router as admin_router
@@ -53,9 +57,16 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing database ...")
         init_database()
         logger.info("Database initialized successfully")
+        await async_db_manager.open()
+        export_job_manager.start()
+        snapshot_refresher.start()
         yield
     finally:
         logger.info("Application shutting down ...")
+        dashboard_live_hub.shutdown()
+        await snapshot_refresher.stop()
+        export_job_manager.shutdown()
+        await async_db_manager.close()
 
 
 app = FastAPI(
@@ -82,6 +93,7 @@ app.add_middleware(RequestLoggingMiddleware)
 # --- Register routers ---
 for r in (
     auth_router,
+    bootstrap_router,
     dashboard_router,
     query_router,
     admin_router,
@@ -0,0 +1,103 @@
+"""In-process cache for query, widget, KPI and menu definitions.
+
+``app_queries``, ``app_dashboard_widgets``, ``app_query_menu_items`` and
+``app_menu_items`` only change through the admin endpoints, yet every query
+execution, export and dashboard load used to read them again. Entries here
+hold the parsed objects (``Query`` models, widget layouts, definition rows)
+and are valid for one metadata version: the admin write endpoints call
+``bump`` after committing, which makes every entry stale at once.
+
+Each worker process has its own cache and version, so a bump only reaches
+the process that handled the admin request; ``METADATA_CACHE_TTL`` bounds
+how long the other workers keep serving the previous definitions.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCache:
+    """Thread-safe map of definitions, invalidated as a whole by a version counter.
+
+    Loaders returning ``None`` (row not found) are not cached, and a load
+    that raises leaves the cache untouched. A value loaded while a bump
+    happened is returned to its caller but not stored.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._version = 0
+        # key -> (version, expires_at, value)
+        self._entries: Dict[Hashable, Tuple[int, float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump(self) -> int:
+        """Invalidate every entry; call after any write to the metadata tables."""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            return self._version
+
+    def _lookup(self, key: Hashable) -> Tuple[bool, Any, int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == self._version and entry[1] > time.monotonic():
+                self.hits += 1
+                return True, entry[2], self._version
+            self.misses += 1
+            return False, None, self._version
+
+    def _store(self, key: Hashable, value: Any, version: int) -> None:
+        if value is None or self.ttl <= 0:
+            return
+        with self._lock:
+            if version != self._version:
+                return
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                self._entries.clear()
+            self._entries[key] = (version, time.monotonic() + self.ttl, value)
+
+    def load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Cached value for ``key``, calling ``loader`` on a miss"""
+        found, value, version = self._lookup(key)
+        if found:
+            return value
+        value = loader()
+        self._store(key, value, version)
+        return value
+
+    async def load_async(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaitable variant of ``load`` for coroutine loaders"""
+        found, value, version = self._lookup(key)
+        if found:
+            return value
+        value = await loader()
+        self._store(key, value, version)
+        return value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self._version,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            }
+
+
+metadata_cache = MetadataCache(settings.METADATA_CACHE_TTL, settings.METADATA_CACHE_MAX_ENTRIES)
@@ -186,6 +186,10 @@ class QueryResult(BaseModel):
     chart_config: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     execution_time: Optional[float] = None
+    # True when served from the result cache
+    cached: bool = False
+    # Set when served from a precomputed snapshot: when it was taken
+    snapshot_at: Optional[datetime] = None
 
 
 class KPI(BaseModel):
@@ -194,14 +198,41 @@ class KPI(BaseModel):
     id: int  # Unique query identifier acting as KPI id
     label: str  # Human-friendly name shown to the user e.g. "Total Assets"
     value: float | int  # Numeric result of KPI query – coerced to float if needed
+    snapshot_at: Optional[datetime] = None  # When the value was computed, if not computed for this request
+    status: str = "ok"  # "ok", "stale" (last known value, evaluation failed or timed out) or "unavailable"
 
 
+class KPIDefinition(BaseModel):
+    """A KPI the user may see, without its value."""
+
+    id: int
+    label: str
+
+
+class BootstrapData(BaseModel):
+    """Everything the frontend needs to render its first screen."""
+
+    user: User
+    menu: List[MenuItem]
+    dashboard: List[DashboardWidget]
+    kpi_definitions: List[KPIDefinition]
+    # Only filled when the caller asks for KPI values
+    kpis: Optional[List[KPI]] = None
+
 # Export Models
 class ExportRequest(BaseModel):
     query_id: Optional[int] = None
     sql_query: Optional[str] = None
-    format: str  # 'excel', 'csv', 'pdf'
+    format: str  # 'excel', 'csv', 'csv_gzip', 'csv_zstd', 'parquet', 'arrow', 'feather'
     filename: Optional[str] = None
+    # Run as a background job and return its id instead of the file
+    background: bool = False
+    # Split large results: 'sheets' (Excel only) or 'files' (ZIP of parts)
+    partition: Optional[str] = None
+    # Rows per sheet/file when partitioned (default EXPORT_PARTITION_ROWS)
+    partition_rows: Optional[int] = None
+    # Fetch in this many parallel slices (row order is not preserved)
+    parallel_slices: Optional[int] = None
 
 
 # Filter Models
@@ -0,0 +1,146 @@
+"""Connection pool telemetry.
+
+Collects acquire-wait histograms and connection lifecycle counters for the
+Oracle pools managed by ``database.py`` and turns them, together with the
+pool's own busy/open gauges, into a JSON-friendly snapshot. Snapshots never
+touch the database, so they are cheap enough for readiness probes.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Upper bounds (milliseconds) of the acquire-wait histogram buckets
+WAIT_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """Thread-safe counters and acquire-wait histogram for one connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._wait_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+            self._wait_sum_ms = 0.0
+            self._wait_max_ms = 0.0
+            self.acquires = 0
+            self.acquire_timeouts = 0
+            self.acquire_errors = 0
+            self.created = 0
+            self.dropped = 0
+            self.pings = 0
+            self.ping_failures = 0
+            self.last_acquire_timeout_at: Optional[float] = None
+
+    def _observe_wait(self, seconds: float) -> None:
+        wait_ms = seconds * 1000
+        for idx, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                break
+        else:
+            idx = len(WAIT_BUCKETS_MS)
+        self._wait_counts[idx] += 1
+        self._wait_sum_ms += wait_ms
+        self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+
+    def record_acquire(self, seconds: float) -> None:
+        with self._lock:
+            self.acquires += 1
+            self._observe_wait(seconds)
+
+    def record_acquire_timeout(self, seconds: float) -> None:
+        with self._lock:
+            self.acquire_timeouts += 1
+            self.last_acquire_timeout_at = time.time()
+            self._observe_wait(seconds)
+
+    def record_acquire_error(self, seconds: float) -> None:
+        with self._lock:
+            self.acquire_errors += 1
+            self._observe_wait(seconds)
+
+    def record_created(self) -> None:
+        with self._lock:
+            self.created += 1
+
+    def session_callback(self, conn: Any, requested_tag: Optional[str]) -> None:
+        """``session_callback`` for oracledb.create_pool: runs when a new session is first handed out."""
+        self.record_created()
+
+    async def async_session_callback(self, conn: Any, requested_tag: Optional[str]) -> None:
+        """Awaitable variant required by oracledb.create_pool_async."""
+        self.record_created()
+
+    def record_dropped(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def record_ping(self, ok: bool) -> None:
+        with self._lock:
+            self.pings += 1
+            if not ok:
+                self.ping_failures += 1
+
+    def _wait_percentile_ms(self, fraction: float) -> Optional[float]:
+        """Upper bucket bound containing the given fraction of acquires (None past the last bucket)."""
+        total = sum(self._wait_counts)
+        if not total:
+            return 0.0
+        threshold = total * fraction
+        running = 0
+        for idx, count in enumerate(self._wait_counts):
+            running += count
+            if running >= threshold:
+                return WAIT_BUCKETS_MS[idx] if idx < len(WAIT_BUCKETS_MS) else None
+        return None
+
+    def snapshot(self, pool: Any = None) -> Dict[str, Any]:
+        """Counters plus the pool's live gauges; ``pool`` may be None if it never opened."""
+        with self._lock:
+            waits = sum(self._wait_counts)
+            histogram = {f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self._wait_counts)}
+            histogram[f"gt_{WAIT_BUCKETS_MS[-1]}ms"] = self._wait_counts[-1]
+            data: Dict[str, Any] = {
+                "name": self.name,
+                "acquires": self.acquires,
+                "acquire_timeouts": self.acquire_timeouts,
+                "acquire_errors": self.acquire_errors,
+                "last_acquire_timeout_at": self.last_acquire_timeout_at,
+                "acquire_wait_ms": {
+                    "histogram": histogram,
+                    "avg": round(self._wait_sum_ms / waits, 3) if waits else 0.0,
+                    "p50": self._wait_percentile_ms(0.50),
+                    "p95": self._wait_percentile_ms(0.95),
+                    "p99": self._wait_percentile_ms(0.99),
+                    "max": round(self._wait_max_ms, 3),
+                },
+                "connections_created": self.created,
+                "connections_dropped": self.dropped,
+                "pings": self.pings,
+                "ping_failures": self.ping_failures,
+            }
+
+        if pool is None:
+            data.update({"open": 0, "busy": 0, "idle": 0, "min": 0, "max": 0, "saturation": None, "connections_destroyed": 0})
+            return data
+
+        try:
+            opened, busy, pool_max = pool.opened, pool.busy, pool.max
+            data.update({
+                "open": opened,
+                "busy": busy,
+                "idle": max(opened - busy, 0),
+                "min": pool.min,
+                "max": pool_max,
+                "saturation": round(busy / pool_max, 3) if pool_max else None,
+                # Every session the pool created and no longer holds was closed,
+                # whether dropped by us, idle-timed-out or found dead on ping.
+                "connections_destroyed": max(data["connections_created"] - opened, 0),
+            })
+        except Exception as exc:
+            data.update({"open": 0, "busy": 0, "idle": 0, "min": 0, "max": 0, "saturation": None, "connections_destroyed": 0, "error": str(exc)})
+        return data
@@ -0,0 +1,122 @@
+"""Short-lived cache of authenticated principals.
+
+Every API request resolves its bearer token through ``get_current_user``,
+which used to decode the JWT and read the user from ``app_users`` each time.
+Entries here map a token (by digest) to its decoded claims and ``User``, so
+repeated requests with the same token skip both. An entry lives at most
+``PRINCIPAL_CACHE_TTL`` seconds and never past the token's own expiry.
+
+Changes to a user (update, delete, password change, role reassignment) must
+call ``invalidate_user`` or ``invalidate_role`` so they take effect on the
+next request; in other worker processes they take effect within the TTL.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from config import settings
+from models import User
+
+logger = logging.getLogger(__name__)
+
+
+class Principal:
+    __slots__ = ("claims", "user", "expires_at")
+
+    def __init__(self, claims: Dict[str, Any], user: User, expires_at: float):
+        self.claims = claims
+        self.user = user
+        self.expires_at = expires_at
+
+
+class PrincipalCache:
+    """Thread-safe LRU map of token digest -> ``Principal``, bounded by entry count."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Principal]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Incremented by every invalidation; a lookup that started before one is not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Tuple[Optional[Principal], int]:
+        """The cached principal for ``token`` (or None) and the generation to pass to ``set``"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry, self._generation
+                del self._entries[key]
+            self.misses += 1
+            return None, self._generation
+
+    def set(self, token: str, claims: Dict[str, Any], user: User, generation: int) -> None:
+        if self.ttl <= 0:
+            return
+        lifetime = self.ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            lifetime = min(lifetime, exp - time.time())
+        if lifetime <= 0:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            key = self._key(token)
+            self._entries[key] = Principal(claims, user, time.monotonic() + lifetime)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _invalidate(self, matches) -> int:
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, entry in self._entries.items() if matches(entry.user)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def invalidate_user(self, user_id: int) -> int:
+        """Drop every cached token of the user ``user_id``"""
+        return self._invalidate(lambda user: user.id == user_id)
+
+    def invalidate_role(self, role: str) -> int:
+        """Drop every cached token of users holding ``role``"""
+        role = role.strip().upper()
+        return self._invalidate(lambda user: role in {r.strip().upper() for r in str(user.role).split(",")})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "invalidations": self.invalidations,
+            }
+
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_TTL, settings.PRINCIPAL_CACHE_MAX_ENTRIES)
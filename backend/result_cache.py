@@ -0,0 +1,198 @@
+"""In-process cache for query results.
+
+``DataService`` stores successful chart and table results here, keyed by
+the normalized SQL, bind values, pagination and filters, so a dashboard
+opened by many users runs each widget query once per TTL. Entries are
+evicted least-recently-used once the cache exceeds its byte budget. Entries
+can be tagged with the ``app_queries`` id they came from and the tables
+their SQL reads, so admin edits and data imports can drop them before they
+expire.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace in ``sql`` and drop a trailing ';'.
+
+    Quoted literals, quoted identifiers and comments are kept verbatim, so
+    two statements only normalize to the same text if Oracle would read them
+    the same way.
+    """
+    sql = sql.strip().rstrip(";").strip()
+    out = []
+    pending_space = False
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if ch.isspace():
+            pending_space = True
+            i += 1
+            continue
+        if pending_space and out:
+            out.append(" ")
+        pending_space = False
+
+        if ch in ("'", '"'):
+            end = sql.find(ch, i + 1)
+        elif sql.startswith("--", i):
+            end = sql.find("\n", i)
+        elif sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            end = end + 1 if end != -1 else -1
+        else:
+            out.append(ch)
+            i += 1
+            continue
+        end = n - 1 if end == -1 else end
+        out.append(sql[i:end + 1])
+        i = end + 1
+    return "".join(out)
+
+
+def query_tag(query_id: int) -> str:
+    """Tag for cache entries computed from the ``app_queries`` row ``query_id``."""
+    return f"query:{query_id}"
+
+
+# Table (or view) names following FROM/JOIN, optionally schema-qualified and quoted
+_TABLE_REF_RE = re.compile(r'\b(?:from|join)\s+((?:"[^"]+"|[\w$#]+)(?:\s*\.\s*(?:"[^"]+"|[\w$#]+))?)', re.IGNORECASE)
+
+
+def table_tag(table: str) -> str:
+    """Tag for cache entries whose SQL reads ``table`` (unqualified, case-insensitive)."""
+    name = table.split(".")[-1].strip()
+    name = name[1:-1] if name.startswith('"') and name.endswith('"') else name.upper()
+    return f"table:{name}"
+
+
+def table_tags(sql: str) -> Tuple[str, ...]:
+    """``table_tag`` of every table referenced after FROM/JOIN in ``sql``."""
+    return tuple(sorted({table_tag(ref) for ref in _TABLE_REF_RE.findall(normalize_sql(sql))}))
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at", "tags")
+
+    def __init__(self, value: Any, size: int, expires_at: float, tags: Tuple[Any, ...]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by total bytes, with a TTL per entry."""
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int, default_ttl: float):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.rejected = 0
+
+    @staticmethod
+    def make_key(kind: str, sql: str, binds: Optional[Dict[str, Any]] = None, **extra: Any) -> str:
+        """Stable key for a result of ``kind`` over ``sql`` with ``binds`` and any other inputs."""
+        material = json.dumps(
+            [kind, normalize_sql(sql), binds or {}, extra], sort_keys=True, default=str, separators=(",", ":")
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[float] = None, tags: Iterable[Any] = ()) -> bool:
+        """Store ``value`` (about ``size`` bytes) for ``ttl`` seconds; returns False if not cached."""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_bytes <= 0:
+            return False
+        if size > self.max_entry_bytes:
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, size, time.monotonic() + ttl, tuple(tags))
+            self._bytes += size
+            self.stores += 1
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def invalidate(self, tag: Any) -> int:
+        """Drop every entry tagged with ``tag``; returns how many were dropped."""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if tag in entry.tags]
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+        if keys:
+            logger.info(f"Result cache: invalidated {len(keys)} entries for {tag}")
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "rejected_too_large": self.rejected,
+            }
+
+
+result_cache = ResultCache(
+    settings.RESULT_CACHE_MAX_BYTES, settings.RESULT_CACHE_MAX_ENTRY_BYTES, settings.RESULT_CACHE_TTL
+)
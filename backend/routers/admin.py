@@ -8,6 +8,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from auth import get_current_user, require_admin, get_password_hash
 from roles_utils import normalize_role, serialize_roles, get_default_role, get_admin_role, get_user_role, is_admin
 from database import db_manager
+from metadata_cache import metadata_cache
+from principal_cache import principal_cache
+from result_cache import query_tag, result_cache
+from snapshots import snapshot_refresher
 from models import (
     APIResponse,
     DashboardWidgetCreate,
@@ -91,7 +95,7 @@ async def list_users(current_user: User = Depends(require_admin)):
         FROM app_users
         ORDER BY created_at DESC
         """
-        result = db_manager.execute_query(query)
+        result = db_manager.execute_query_rows(query)
         users: List[dict] = []
         for row in result:
             from auth import normalize_role
@@ -155,6 +159,7 @@ async def update_user_admin(user_id: int, request: UserUpdate, current_user: Use
         sql = f"UPDATE app_users SET {set_clause} WHERE id = :{len(params)+1}"
         params.append(user_id)
         db_manager.execute_non_query(sql, tuple(params))
+        principal_cache.invalidate_user(user_id)
         return APIResponse(success=True, message="User updated successfully")
     except HTTPException:
         raise
@@ -167,6 +172,7 @@ async def update_user_admin(user_id: int, request: UserUpdate, current_user: Use
 async def delete_user_admin(user_id: int, current_user: User = Depends(require_admin)):
     try:
         db_manager.execute_non_query("DELETE FROM app_users WHERE id = :1", (user_id,))
+        principal_cache.invalidate_user(user_id)
         return APIResponse(success=True, message="User deleted successfully")
     except HTTPException:
         raise
@@ -235,15 +241,20 @@ async def create_query(request: QueryCreate, current_user: User = Depends(requir
             INSERT INTO app_query_menu_items (query_id, menu_item_id) 
             VALUES (:query_id, :menu_item_id)
             """
-            for menu_id in request.menu_item_ids:
-                if not QueryUtils.is_default_dashboard(menu_id):
-                    try:
-                        db_manager.execute_non_query(junction_sql, {
-                            "query_id": new_query_id, 
-                            "menu_item_id": menu_id
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to associate query {new_query_id} with menu {menu_id}: {e}")
+            menu_ids = [m for m in request.menu_item_ids if not QueryUtils.is_default_dashboard(m)]
+            try:
+                junction_result = db_manager.execute_many(
+                    junction_sql,
+                    [{"query_id": new_query_id, "menu_item_id": menu_id} for menu_id in menu_ids],
+                    batch_errors=True,
+                )
+                for err in junction_result.errors:
+                    logger.warning(
+                        f"Failed to associate query {new_query_id} with menu {menu_ids[err.offset]}: {err.message}"
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to associate query {new_query_id} with menus {menu_ids}: {e}")
+        metadata_cache.bump()
         
         if new_query_id:
             logger.info(f"Query created successfully with ID: {new_query_id}")
@@ -386,10 +397,14 @@ async def update_query_admin(query_id: int, request: QueryCreate, current_user:
         if request.menu_item_ids:
             db_manager.execute_non_query("DELETE FROM app_query_menu_items WHERE query_id = :1", (query_id,))
             junction_sql = "INSERT INTO app_query_menu_items (query_id, menu_item_id) VALUES (:query_id, :menu_item_id)"
-            for menu_id in request.menu_item_ids:
-                if menu_id != -1:
-                    db_manager.execute_non_query(junction_sql, {"query_id": query_id, "menu_item_id": menu_id})
+            db_manager.execute_many(
+                junction_sql,
+                [{"query_id": query_id, "menu_item_id": menu_id} for menu_id in request.menu_item_ids if menu_id != -1],
+            )
         
+        metadata_cache.bump()
+        result_cache.invalidate(query_tag(query_id))
+        snapshot_refresher.discard(query_id)
         return APIResponse(success=True, message="Query updated successfully")
     except HTTPException:
         raise
@@ -415,6 +430,9 @@ async def delete_query_admin(query_id: int, current_user: User = Depends(require
             )
 
         db_manager.execute_non_query("DELETE FROM app_queries WHERE id = :1", (query_id,))
+        metadata_cache.bump()
+        result_cache.invalidate(query_tag(query_id))
+        snapshot_refresher.discard(query_id)
         return APIResponse(success=True, message="Query deleted successfully")
     except HTTPException:
         raise
@@ -432,7 +450,7 @@ async def list_all_queries(current_user: User = Depends(get_current_user)):
         WHERE q.is_active = 1
         ORDER BY q.created_at DESC
         """
-        result = db_manager.execute_query(query)
+        result = db_manager.execute_query_rows(query)
         queries: List[dict] = []
         for row in result:
             menu_names = []
@@ -444,7 +462,7 @@ async def list_all_queries(current_user: User = Depends(get_current_user)):
                 WHERE qm.query_id = :1
                 ORDER BY m.name
                 """
-                menu_result = db_manager.execute_query(menu_query, (row["id"],))
+                menu_result = db_manager.execute_query_rows(menu_query, (row["id"],))
                 menu_names = [r["name"] for r in menu_result]
             except Exception as exc:
                 logger.warning(f"Could not get menu assignments for query {row['id']}: {exc}")
@@ -499,6 +517,7 @@ async def create_dashboard_widget(request: DashboardWidgetCreate, current_user:
                 "height": request.height,
             },
         )
+        metadata_cache.bump()
         result = db_manager.execute_query(
             "SELECT id FROM app_dashboard_widgets WHERE title = :1 ORDER BY created_at DESC",
             (request.title,),
@@ -519,6 +538,7 @@ async def delete_dashboard_widget(widget_id: int, current_user: User = Depends(g
         if not check:
             raise HTTPException(status_code=404, detail="Widget not found")
         db_manager.execute_non_query("DELETE FROM app_dashboard_widgets WHERE id = :1", (widget_id,))
+        metadata_cache.bump()
         return APIResponse(success=True, message=f"Widget {widget_id} deleted successfully")
     except HTTPException:
         raise
@@ -556,6 +576,7 @@ async def update_dashboard_widget(widget_id: int, request: DashboardWidgetUpdate
         update_sql = f"UPDATE app_dashboard_widgets SET {', '.join(fields)} WHERE id = :{len(params)+1}"
         params.append(widget_id)
         db_manager.execute_non_query(update_sql, tuple(params))
+        metadata_cache.bump()
 
         return APIResponse(success=True, message="Widget updated")
     except HTTPException:
@@ -576,7 +597,7 @@ async def list_dashboard_widgets(current_user: User = Depends(get_current_user))
         WHERE w.is_active = 1 AND q.is_active = 1
         ORDER BY w.position_y, w.position_x
         """
-        result = db_manager.execute_query(query)
+        result = db_manager.execute_query_rows(query)
         widgets: List[dict] = []
         for row in result:
             widgets.append(
@@ -609,7 +630,7 @@ async def list_kpis(current_user: User = Depends(get_current_user)):
         WHERE q.is_active = 1 AND q.is_kpi = 1
         ORDER BY q.created_at DESC
         """
-        result = db_manager.execute_query(query)
+        result = db_manager.execute_query_rows(query)
 
         kpis: List[dict] = []
         for row in result:
@@ -667,6 +688,7 @@ async def create_kpi(request: QueryCreate, current_user: User = Depends(require_
         
         db_manager.execute_non_query(insert_sql, params)
         logger.info(f"Successfully created KPI: {request.name}")
+        metadata_cache.bump()
         
         # Get the newly created KPI ID
         # Get the newly created KPI ID
@@ -709,25 +731,26 @@ async def update_kpi(kpi_id: int, request: QueryCreate, current_user: User = Dep
         if not exists:
             raise HTTPException(status_code=404, detail="KPI not found")
         
-        update_sql = """
-        UPDATE app_queries
-        SET name=:1, description=:2, sql_query=:3, menu_item_id=:4, role=:5
-        WHERE id=:6 AND is_kpi=1
-        """
         db_menu_item_id = None if request.menu_item_id == -1 else request.menu_item_id
         
         roles_list = request.role if isinstance(request.role, list) else ([request.role] if request.role else [])
-        db_manager.execute_non_query(
-            update_sql,
-            (
-                request.name,
-                request.description,
-                request.sql_query,
-                db_menu_item_id,
-                serialize_roles(request.role) or get_default_role(),
-                kpi_id,
-            ),
-        )
+        fields = ["name=:1", "description=:2", "sql_query=:3", "menu_item_id=:4", "role=:5"]
+        params = [
+            request.name,
+            request.description,
+            request.sql_query,
+            db_menu_item_id,
+            serialize_roles(request.role) or get_default_role(),
+        ]
+        # chart_config only changes when the request carries it; null clears it
+        if "chart_config" in request.model_fields_set:
+            params.append(json.dumps(request.chart_config or {}))
+            fields.append(f"chart_config=:{len(params)}")
+        params.append(kpi_id)
+        update_sql = f"UPDATE app_queries SET {', '.join(fields)} WHERE id=:{len(params)} AND is_kpi=1"
+        db_manager.execute_non_query(update_sql, tuple(params))
+        metadata_cache.bump()
+        snapshot_refresher.discard(kpi_id)
         return APIResponse(success=True, message="KPI updated successfully")
     except HTTPException:
         raise
@@ -744,6 +767,8 @@ async def delete_kpi(kpi_id: int, current_user: User = Depends(require_admin)):
             raise HTTPException(status_code=404, detail="KPI not found")
 
         db_manager.execute_non_query("DELETE FROM app_queries WHERE id = :1 AND is_kpi = 1", (kpi_id,))
+        metadata_cache.bump()
+        snapshot_refresher.discard(kpi_id)
         return APIResponse(success=True, message="KPI deleted successfully")
     except HTTPException:
         raise
@@ -815,6 +840,7 @@ async def create_menu_item(request: MenuItemCreate, current_user: User = Depends
         
         affected, new_id = db_manager.execute_insert(insert_sql, params)
         logger.info(f"Created menu item: {request.name}, ID: {new_id}, Affected: {affected}")
+        metadata_cache.bump()
         
         response_data = {"menu_id": new_id}
         
@@ -859,6 +885,7 @@ async def update_menu_item(menu_id: int, request: MenuItemCreate, current_user:
         
         db_manager.execute_non_query(update_sql, params)
         logger.info(f"Updated menu item: {menu_id}")
+        metadata_cache.bump()
         
         return APIResponse(success=True, message="Menu item updated successfully")
     except HTTPException:
@@ -882,6 +909,7 @@ async def delete_menu_item(menu_id: int, current_user: User = Depends(require_ad
              raise HTTPException(status_code=400, detail="Cannot delete menu item with children")
 
         db_manager.execute_non_query("DELETE FROM app_menu_items WHERE id = :1", (menu_id,))
+        metadata_cache.bump()
         return APIResponse(success=True, message="Menu item deleted successfully")
     except HTTPException:
         raise
@@ -15,6 +15,7 @@ from failure_tracker import failure_tracker
 from models import APIResponse, Token, User, UserLogin
 from auth import verify_password, get_password_hash
 from database import db_manager
+from principal_cache import principal_cache
 from input_validation import InputValidator
 
 logger = logging.getLogger(__name__)
@@ -142,6 +143,7 @@ async def change_password(request_data: PasswordChangeRequest, current_user: Use
         "UPDATE app_users SET password_hash=:1, must_change_password=0 WHERE id=:2",
         (new_hash, current_user.id),
     )
+    principal_cache.invalidate_user(current_user.id)
 
     return APIResponse(success=True, message="Password changed successfully")
 
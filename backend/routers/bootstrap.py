@@ -0,0 +1,39 @@
+import asyncio
+import logging
+
+from fastapi import APIRouter, Depends
+
+from auth import get_current_user
+from models import BootstrapData, KPIDefinition, User
+from roles_utils import is_admin
+from services import DashboardService, KPIService, MenuService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api", tags=["bootstrap"])
+
+
+@router.get("/bootstrap", response_model=BootstrapData)
+async def bootstrap(kpi_values: bool = False, current_user: User = Depends(get_current_user)):
+    """User, menu tree, default dashboard layout and KPIs for the first screen in one call.
+
+    Replaces the /auth/me, /api/menu, /api/dashboard and /api/kpis calls made
+    on startup: the token is checked once and the three metadata queries run
+    concurrently. KPI values are only evaluated with ``kpi_values=true``.
+    """
+    menu_role = None if is_admin(current_user.role) else current_user.role
+    menu, widgets, kpi_rows = await asyncio.gather(
+        MenuService.get_menu_structure_async(menu_role, current_user.hidden_features),
+        DashboardService.get_dashboard_layout_async(None),
+        KPIService.get_kpi_definitions_async(current_user.role, None),
+    )
+
+    widgets = [w for w in widgets if (not w.query) or DashboardService.role_allows(w.query.role, current_user.role)]
+    kpis = await KPIService.evaluate_kpis_async(kpi_rows) if kpi_values else None
+    return BootstrapData(
+        user=current_user,
+        menu=menu,
+        dashboard=widgets,
+        kpi_definitions=[KPIDefinition(id=row["id"], label=row["name"]) for row in kpi_rows],
+        kpis=kpis,
+    )
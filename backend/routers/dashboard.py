@@ -1,13 +1,17 @@
 from typing import List, Optional
+import asyncio
 import json
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 
+from auth import get_current_user, get_user_from_token
+from dashboard_live import dashboard_live_hub
 from roles_utils import get_admin_role, get_default_role, is_admin
-from database import db_manager
+from config import settings
 from models import DashboardWidget, QueryResult, User, UserRole, KPI
-from services import DashboardService, DataService, KPIService
+from services import DashboardService, KPIService, MenuService
 
 logger = logging.getLogger(__name__)
 
@@ -17,16 +21,11 @@ router = APIRouter(prefix="/api", tags=["dashboard"])
 @router.get("/dashboard", response_model=List[DashboardWidget])
 async def get_dashboard(menu_id: int = None, current_user: User = Depends(get_current_user)):
     """Return dashboard layout filtered by user role and optionally by menu item."""
-    widgets = DashboardService.get_dashboard_layout(menu_id)
+    widgets = await DashboardService.get_dashboard_layout_async(menu_id)
     # Only filter by role if user is not admin (admins see all menus)
     user_role = None if is_admin(current_user.role) else current_user.role
     if user_role: # If user_role is not None (i.e., user is not admin), apply filtering
-        widgets = [
-            w
-            for w in widgets
-            if (not w.query) or (w.query.role in (None, "", user_role)) or 
-               (w.query.role and user_role.upper() in [r.strip().upper() for r in w.query.role.split(',')])
-        ]
+        widgets = [w for w in widgets if (not w.query) or DashboardService.role_allows(w.query.role, current_user.role)]
     return widgets
 
 
@@ -34,37 +33,175 @@ async def get_dashboard(menu_id: int = None, current_user: User = Depends(get_cu
 async def get_widget_data(widget_id: int, timeout: int = 45, current_user: User = Depends(get_current_user)):
     """Fetch and execute underlying SQL for a dashboard widget, returning chart-ready data with timeout."""
     try:
-        query = """
-        SELECT q.sql_query, q.chart_type, q.chart_config
-        FROM app_dashboard_widgets w
-        JOIN app_queries q ON w.query_id = q.id
-        WHERE w.id = :1 AND w.is_active = 1 AND q.is_active = 1
-        """
-        result = db_manager.execute_query(query, (widget_id,))
-        if not result:
+        widget_data = await DashboardService.get_widget_query_async(widget_id)
+        if widget_data is None:
             raise HTTPException(status_code=404, detail="Widget not found")
 
-        widget_data = result[0]
-        chart_config = {}
-        if widget_data["chart_config"]:
-            try:
-                chart_config = json.loads(widget_data["chart_config"])
-            except Exception:
-                chart_config = {}
-
-        return DataService.execute_query_for_chart(
-            widget_data["sql_query"], widget_data["chart_type"], chart_config, timeout=timeout
+        return await DashboardService.widget_result_async(
+            widget_data["query_id"], widget_data["sql_query"], widget_data["chart_type"], widget_data["chart_config"], timeout
         )
     except Exception as exc:
         logger.error(f"Error getting widget data: {exc}")
         return QueryResult(success=False, error=str(exc))
 
 
+def _stream_event(kind: str, payload: dict, sse: bool) -> str:
+    body = json.dumps({"type": kind, **payload}, default=str)
+    return f"event: {kind}\ndata: {body}\n\n" if sse else body + "\n"
+
+
+@router.get("/dashboard/{menu_id}/data")
+async def get_dashboard_data(
+    menu_id: int,
+    request: Request,
+    timeout: int = 45,
+    include_kpis: bool = True,
+    format: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Execute every widget of a dashboard (menu_id 0 = default dashboard) in one request.
+
+    Widgets run concurrently and each result is streamed as soon as it is
+    ready, as NDJSON lines or, with ``format=sse`` or ``Accept:
+    text/event-stream``, as server-sent events. Each item is
+    ``{"type": "widget", "widget_id", "title", "result"}``; with
+    ``include_kpis`` one ``{"type": "kpis", "kpis"}`` item follows the same
+    path, and a final ``{"type": "done"}`` closes the stream.
+    """
+    fmt = (format or "").lower()
+    if fmt not in ("", "ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+    sse = fmt == "sse" or (not fmt and "text/event-stream" in request.headers.get("accept", ""))
+
+    rows = await DashboardService.get_widget_queries_async(menu_id or None)
+    widgets = [row for row in rows if DashboardService.role_allows(row["role"], current_user.role)]
+    semaphore = asyncio.Semaphore(settings.DASHBOARD_WIDGET_CONCURRENCY)
+
+    async def run_widget(row) -> str:
+        try:
+            async with semaphore:
+                result = await DashboardService.widget_result_async(
+                    row["query_id"], row["sql_query"], row["chart_type"], row["chart_config"], timeout
+                )
+        except Exception as exc:
+            logger.error(f"Error getting widget data for widget {row['id']}: {exc}")
+            result = QueryResult(success=False, error=str(exc))
+        payload = {"widget_id": row["id"], "title": row["title"], "result": result.model_dump(mode="json")}
+        return _stream_event("widget", payload, sse)
+
+    async def run_kpis() -> str:
+        try:
+            kpis = await KPIService.get_kpis_async(current_user.role, menu_id or None)
+        except Exception as exc:
+            logger.error(f"Error getting KPIs: {exc}")
+            kpis = []
+        return _stream_event("kpis", {"kpis": [kpi.model_dump(mode="json") for kpi in kpis]}, sse)
+
+    async def stream():
+        tasks = [asyncio.ensure_future(run_widget(row)) for row in widgets]
+        if include_kpis:
+            tasks.append(asyncio.ensure_future(run_kpis()))
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+            yield _stream_event("done", {"widgets": len(widgets)}, sse)
+        finally:
+            # Client went away: stop widgets that have not finished yet
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/dashboard/{menu_id}/live")
+async def live_dashboard_sse(menu_id: int, current_user: User = Depends(get_current_user)):
+    """Subscribe to pushed widget updates of a dashboard (menu_id 0 = default) as server-sent events.
+
+    The current state of every visible widget arrives first; afterwards a
+    ``widget`` event is sent whenever a widget's data changes. Comment lines
+    keep idle connections open.
+    """
+    if not await _live_menu_allowed(menu_id, current_user.role):
+        raise HTTPException(status_code=404, detail="Dashboard not found")
+    subscriber = dashboard_live_hub.subscribe(menu_id, current_user.role)
+
+    async def stream():
+        try:
+            while True:
+                try:
+                    messages = await asyncio.wait_for(
+                        subscriber.next_messages(), settings.DASHBOARD_KEEPALIVE_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                for message in messages:
+                    yield f"event: widget\ndata: {message}\n\n"
+        finally:
+            dashboard_live_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# Browsers cannot set an Authorization header on WebSockets. The JWT is
+# offered as a second subprotocol instead (``new WebSocket(url, ["bearer",
+# token])``) so it stays out of URLs, and with them out of access and proxy logs.
+WS_AUTH_SUBPROTOCOL = "bearer"
+
+
+@router.websocket("/dashboard/{menu_id}/live/ws")
+async def live_dashboard_ws(websocket: WebSocket, menu_id: int):
+    """WebSocket variant of ``live_dashboard_sse``; the JWT comes in ``Sec-WebSocket-Protocol: bearer, <token>``."""
+    protocols = websocket.scope.get("subprotocols") or []
+    token = protocols[1] if len(protocols) == 2 and protocols[0] == WS_AUTH_SUBPROTOCOL else None
+    user = await get_user_from_token(token) if token else None
+    if user is None or not await _live_menu_allowed(menu_id, user.role):
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept(subprotocol=WS_AUTH_SUBPROTOCOL)
+    subscriber = dashboard_live_hub.subscribe(menu_id, user.role)
+    # Reading is only needed to notice the client closing the socket
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(websocket))
+    try:
+        while True:
+            receive = asyncio.ensure_future(subscriber.next_messages())
+            await asyncio.wait({receive, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                receive.cancel()
+                break
+            for message in receive.result():
+                await websocket.send_text(message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        dashboard_live_hub.unsubscribe(subscriber)
+
+
+async def _live_menu_allowed(menu_id: int, user_role) -> bool:
+    """Live channels only start for the default dashboard (0) or a menu the user can see."""
+    return menu_id == 0 or await MenuService.menu_visible_async(menu_id, user_role)
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
 @router.get("/kpis", response_model=List[KPI])
 async def get_kpis(menu_id: Optional[int] = None, current_user: User = Depends(get_current_user)):
     """Return list of KPI metrics available for the current user, optionally filtered by menu."""
     try:
-        return KPIService.get_kpis(current_user.role, menu_id)
+        return await KPIService.get_kpis_async(current_user.role, menu_id)
     except Exception as e:
         # Log the error but return an empty list instead of failing
         import logging
@@ -1,6 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from models import APIResponse
-from database import db_manager
+from config import settings
+from database import WORKLOAD_INTERACTIVE, WORKLOAD_META, async_db_manager, db_manager
+from dashboard_live import dashboard_live_hub
+from metadata_cache import metadata_cache
+from principal_cache import principal_cache
+from result_cache import result_cache
+from single_flight import query_flight
+from snapshots import snapshot_refresher
 
 router = APIRouter(tags=["system"])
 
@@ -15,7 +22,55 @@ async def root():
 async def health_check():
     """Simple database connectivity check."""
     try:
-        db_manager.execute_query("SELECT 1 FROM DUAL")
-        return APIResponse(success=True, message="System healthy", data={"database": "connected"})
+        latency = db_manager.ping()
+        return APIResponse(
+            success=True,
+            message="System healthy",
+            data={"database": "connected", "ping_ms": round(latency * 1000, 2)},
+        )
     except Exception as exc:
-        return APIResponse(success=False, error=f"Database connection failed: {exc}")
\ No newline at end of file
+        return APIResponse(success=False, error=f"Database connection failed: {exc}")
+
+
+@router.get("/health/ready", response_model=APIResponse)
+async def readiness_check(response: Response):
+    """Readiness probe based on pool saturation; never queries the database."""
+    pools = {"sync": db_manager.pool_stats()}
+    async_stats = async_db_manager.pool_stats()
+    if async_stats is not None:
+        pools["async"] = async_stats
+
+    problems = []
+    if db_manager.pool is None:
+        problems.append("interactive pool unavailable")
+    # The bulk pool is expected to run full during exports; only the pools
+    # serving regular requests decide readiness.
+    for kind, named in pools.items():
+        for name in (WORKLOAD_META, WORKLOAD_INTERACTIVE):
+            stats = named[name]
+            saturation = stats.get("saturation")
+            if saturation is not None and saturation >= settings.DB_POOL_READY_SATURATION:
+                problems.append(f"{kind} {name} pool saturated ({stats['busy']}/{stats['max']} busy)")
+
+    data = {"ready": not problems, "pools": pools}
+    if problems:
+        response.status_code = 503
+        return APIResponse(success=False, error="; ".join(problems), data=data)
+    return APIResponse(success=True, message="Ready", data=data)
+
+
+@router.get("/health/cache", response_model=APIResponse)
+async def cache_stats():
+    """Result, metadata and principal cache, coalescing, snapshot and live dashboard counters."""
+    return APIResponse(
+        success=True,
+        message="Result cache statistics",
+        data={
+            "result_cache": result_cache.snapshot(),
+            "metadata_cache": metadata_cache.snapshot(),
+            "principal_cache": principal_cache.snapshot(),
+            "single_flight": query_flight.snapshot(),
+            "snapshots": snapshot_refresher.stats(),
+            "live_dashboards": dashboard_live_hub.stats(),
+        },
+    )
@@ -7,7 +7,14 @@ import logging
 from typing import List
 
 from auth import get_current_user
-from database import db_manager
+from database import (
+    WORKLOAD_BULK,
+    WORKLOAD_META,
+    BatchExecutionError,
+    ExecuteManyResult,
+    async_db_manager,
+    db_manager,
+)
 from failure_tracker import failure_tracker
 from models import (
     APIResponse,
@@ -17,12 +24,48 @@ from models import (
     User,
 )
 from config import settings
+from result_cache import result_cache, table_tag
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["import"])
 
 
+def _sanitize_import_error(msg: str) -> str:
+    """Map Oracle errors to messages that are safe to show to users."""
+    sanitized_error = "Data validation error"
+
+    # Oracle Error Mapping
+    if "ORA-12899" in msg: # value too large for column
+        sanitized_error = "Value too large for column"
+    elif "ORA-01400" in msg: # cannot insert NULL
+        sanitized_error = "Required field is empty"
+    elif "ORA-02291" in msg: # integrity constraint violated - parent key not found
+        sanitized_error = "Invalid reference value (Foreign Key missing)"
+    elif "ORA-00001" in msg: # unique constraint violated
+        sanitized_error = "Duplicate entry"
+    elif "ORA-01861" in msg or "ORA-01843" in msg or "ORA-01847" in msg: # literal does not match format string / not a valid month / day of month invalid
+        sanitized_error = "Invalid date format"
+    elif "ORA-01722" in msg: # invalid number
+        sanitized_error = "Invalid number format"
+    return sanitized_error
+
+
+def _bind_rows(df: pd.DataFrame) -> List[tuple]:
+    """Row tuples of plain Python values for array binding (NaN/NaT become NULL).
+
+    Array binds are typed per column, so a column mixing types (e.g. numbers
+    and text in one Excel column) is sent as text and left to Oracle to
+    convert, which reports bad values per row like single-row inserts did.
+    """
+    frame = df.astype(object).where(df.notna(), None)
+    for col in frame.columns:
+        kinds = {type(v) for v in frame[col] if v is not None}
+        if len(kinds) > 1 and not kinds <= {int, float}:
+            frame[col] = [None if v is None else str(v) for v in frame[col]]
+    return list(frame.itertuples(index=False, name=None))
+
+
 @router.post("/report/{table_name}/import", response_model=APIResponse)
 async def import_report_data(
     table_name: str,
@@ -86,17 +129,17 @@ async def import_report_data(
             "WHERE TABLE_NAME = :1"
         )
         meta = db_manager.execute_query(
-            cols_query, (table_name.upper(),)
+            cols_query, (table_name.upper(),), workload=WORKLOAD_META
         )
         if not meta:
             # Try replacing spaces with underscores (common mismatch between report names and table names)
             alt_name = table_name.replace(" ", "_").upper()
             if alt_name != table_name.upper():
-                meta = db_manager.execute_query(cols_query, (alt_name,))
+                meta = db_manager.execute_query(cols_query, (alt_name,), workload=WORKLOAD_META)
         
         if not meta:
             # Try exact match as provided
-            meta = db_manager.execute_query(cols_query, (table_name,))
+            meta = db_manager.execute_query(cols_query, (table_name,), workload=WORKLOAD_META)
         
         if not meta:
             raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found. Please verify the report name matches the target database table.")
@@ -125,38 +168,60 @@ async def import_report_data(
     col_names_sql = ", ".join(insert_cols)
     insert_sql = f"INSERT INTO {final_table_name} ({col_names_sql}) VALUES ({placeholders})"
 
-    for idx, row in df.iterrows():
+    rows = _bind_rows(df[insert_cols])
+
+    if import_mode == ImportMode.ABORT_ON_ERROR:
+        # Rows before the first failing one are committed and reported as inserted; the rest are not loaded
+        try:
+            outcome = await async_db_manager.execute_many(
+                insert_sql,
+                rows,
+                batch_size=settings.IMPORT_BATCH_SIZE,
+                commit_before_error=True,
+                workload=WORKLOAD_BULK,
+            )
+            inserted = outcome.rowcount
+        except BatchExecutionError as exc:
+            inserted = exc.result.rowcount
+            failed = 1
+            row_label = f"Row {df.index[exc.offset] + 1}" if exc.offset is not None else "Import"
+            errors.append(f"{row_label}: {_sanitize_import_error(str(exc))}")
+        except Exception as exc:
+            logger.error(f"Bulk import into {final_table_name} failed: {exc}")
+            failed = total_records
+            errors.append(f"Import failed: {_sanitize_import_error(str(exc))}")
+    else:
+        # Valid rows are committed batch by batch; rejected rows are reported individually
         try:
-            # Handle potential NaN/None values compatible with Oracle
-            values = tuple((None if pd.isna(row[col]) else row[col]) for col in insert_cols)
-            db_manager.execute_non_query(insert_sql, values)
-            inserted += 1
+            outcome = await async_db_manager.execute_many(
+                insert_sql,
+                rows,
+                batch_size=settings.IMPORT_BATCH_SIZE,
+                batch_errors=True,
+                commit_per_batch=True,
+                workload=WORKLOAD_BULK,
+            )
+        except BatchExecutionError as exc:
+            # A failure outside Oracle's per-row reporting: rows from the failed batch on were not loaded
+            outcome = exc.result
+            not_loaded = total_records - outcome.rowcount - len(outcome.errors)
+            failed += not_loaded
+            row_label = f"Row {df.index[exc.offset] + 1}" if exc.offset is not None else "Import"
+            errors.append(f"{row_label}: {_sanitize_import_error(str(exc))} ({not_loaded} rows not imported)")
         except Exception as exc:
-            failed += 1
-            # Sanitize database errors for user display (Oracle error patterns)
-            msg = str(exc)
-            sanitized_error = "Data validation error"
-            
-            # Oracle Error Mapping
-            if "ORA-12899" in msg: # value too large for column
-                sanitized_error = "Value too large for column"
-            elif "ORA-01400" in msg: # cannot insert NULL
-                sanitized_error = "Required field is empty"
-            elif "ORA-02291" in msg: # integrity constraint violated - parent key not found
-                sanitized_error = "Invalid reference value (Foreign Key missing)"
-            elif "ORA-00001" in msg: # unique constraint violated
-                sanitized_error = "Duplicate entry"
-            elif "ORA-01861" in msg or "ORA-01843" in msg or "ORA-01847" in msg: # literal does not match format string / not a valid month / day of month invalid
-                sanitized_error = "Invalid date format"
-            elif "ORA-01722" in msg: # invalid number
-                sanitized_error = "Invalid number format"
-
-            error_msg = f"Row {idx+1}: {sanitized_error}"
-            # logger.warning(f"Import error for row {idx+1}: {exc}")
-            errors.append(error_msg)
-            if import_mode == ImportMode.ABORT_ON_ERROR:
-                break
-            # else continue inserting next rows
+            logger.error(f"Bulk import into {final_table_name} failed: {exc}")
+            outcome = ExecuteManyResult()
+            failed = total_records
+            errors.append(f"Import failed: {_sanitize_import_error(str(exc))}")
+        inserted = outcome.rowcount
+        failed += len(outcome.errors)
+        errors = [
+            f"Row {df.index[err.offset] + 1}: {_sanitize_import_error(err.message)}" for err in outcome.errors
+        ] + errors
+
+    if inserted:
+        # Cached report results over this table no longer match its rows
+        result_cache.invalidate(table_tag(final_table_name))
 
     success = failed == 0 or import_mode == ImportMode.SKIP_FAILED
     
@@ -15,4 +15,4 @@ async def get_menu(current_user: User = Depends(get_current_user)):
     """Return hierarchical application menu for authenticated user."""
     # Only filter by role if user is not admin (admins see all menus)
     user_role = None if is_admin(current_user.role) else current_user.role
-    return MenuService.get_menu_structure(user_role, current_user.hidden_features)
\ No newline at end of file
+    return await MenuService.get_menu_structure_async(user_role, current_user.hidden_features)
\ No newline at end of file
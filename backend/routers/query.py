@@ -1,9 +1,10 @@
 import logging
-import asyncio
+import itertools
+import os
+import re
+import tempfile
 
-from functools import partial
-
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from auth import get_current_user
 from roles_utils import is_admin
@@ -20,8 +21,10 @@ from models import (
 from services import DataService, QueryService
 # New import for file export
 from services import ExportService
-from fastapi.responses import Response
-from database import db_manager
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from export_jobs import JOB_COMPLETED, export_job_manager
 from datetime import datetime
 from sql_utils import validate_sql
 
@@ -32,10 +35,11 @@ router = APIRouter(prefix="/api", tags=["query"])
 
 @router.post("/query/execute", response_model=QueryResult)
 async def execute_query(request: QueryExecute, current_user: User = Depends(get_current_user)):
+    query_obj = None
     try:
         if request.query_id:
             # Execute saved query
-            query_obj = QueryService.get_query_by_id(request.query_id)
+            query_obj = await QueryService.get_query_by_id_async(request.query_id)
             if not query_obj:
                 raise HTTPException(status_code=404, detail="Query not found")
             logger.info(f"AUTHORIZATION CHECK - Query ID: {request.query_id}, User: {current_user.username}, User Role: '{current_user.role}', Query Roles: '{query_obj.role}'")
@@ -68,16 +72,20 @@ async def execute_query(request: QueryExecute, current_user: User = Depends(get_
             validate_sql(sanitized_sql)
 
             if query_obj.chart_type and query_obj.chart_type != "table":
-                return DataService.execute_query_for_chart(
-                    sanitized_sql, query_obj.chart_type, query_obj.chart_config
+                return await DataService.execute_query_for_chart_async(
+                    sanitized_sql, query_obj.chart_type, query_obj.chart_config, query_id=query_obj.id
                 )
             else:
-                return DataService.execute_query_for_table(
-                    sanitized_sql, request.limit, request.offset
+                return await DataService.execute_query_for_table_async(
+                    sanitized_sql,
+                    request.limit,
+                    request.offset,
+                    query_id=query_obj.id,
+                    chart_config=query_obj.chart_config,
                 )
         elif request.sql_query:
             validate_sql(request.sql_query)
-            return DataService.execute_query_for_table(
+            return await DataService.execute_query_for_table_async(
                 request.sql_query, request.limit, request.offset
             )
         else:
@@ -89,15 +97,11 @@ async def execute_query(request: QueryExecute, current_user: User = Depends(get_
     except Exception as exc:
         logger.error(f"Error executing query: {exc}")
         
-        # Track the failure
+        # Track the failure (the saved query was already loaded above)
         query_id = request.query_id if hasattr(request, 'query_id') else None
         sql_query = request.sql_query if hasattr(request, 'sql_query') else ""
-        if query_id and not sql_query:
-            try:
-                query_obj = QueryService.get_query_by_id(query_id)
-                sql_query = query_obj.sql_query if query_obj else ""
-            except:
-                pass
+        if query_id and not sql_query and query_obj:
+            sql_query = query_obj.sql_query
         
         failure_tracker.track_query_failure(
             query_id=query_id,
@@ -128,7 +132,7 @@ async def get_query_detail(query_id: int, current_user: User = Depends(get_curre
     """
 
     try:
-        query_obj = QueryService.get_query_by_id(query_id)
+        query_obj = await QueryService.get_query_by_id_async(query_id)
         if not query_obj:
             return APIResponse(success=False, error="Query not found")
 
@@ -160,7 +164,7 @@ async def execute_filtered_query(request: FilteredQueryRequest, current_user: Us
 
     try:
         if request.query_id:
-            query_obj = QueryService.get_query_by_id(request.query_id)
+            query_obj = await QueryService.get_query_by_id_async(request.query_id)
             if not query_obj:
                 raise HTTPException(status_code=404, detail="Query not found")
 
@@ -169,7 +173,7 @@ async def execute_filtered_query(request: FilteredQueryRequest, current_user: Us
                 if assigned_roles and current_user.role.upper() not in assigned_roles:
                     raise HTTPException(status_code=403, detail="Not authorised for this query")
 
-        return DataService.execute_filtered_query(request)
+        return await DataService.execute_filtered_query_async(request)
     except HTTPException:
         raise
     except Exception as exc:
@@ -202,22 +206,30 @@ async def get_reports_by_menu(menu_item_id: int, current_user: User = Depends(ge
 
 
 @router.post("/export")
-async def export_query_data(request: ExportRequest, current_user: User = Depends(get_current_user)):
-    """Export data for a given query ID or raw SQL to CSV or Excel.
+async def export_query_data(
+    request: ExportRequest, response: Response, current_user: User = Depends(get_current_user)
+):
+    """Export data for a given query ID or raw SQL.
 
     The client posts an ``ExportRequest`` specifying either ``query_id`` or
-    ``sql_query`` and the desired ``format`` (``csv`` or ``excel``). We execute
+    ``sql_query`` and the desired ``format`` (a key of
+    ``ExportService.EXPORT_FORMATS``: ``csv``, ``excel``, ``parquet``,
+    ``arrow``/``feather``, ``csv_gzip`` or ``csv_zstd``). ``partition``
+    splits large results: ``sheets`` across worksheets of one Excel file,
+    ``files`` into a ZIP of ``partition_rows``-row files written in parallel. We execute
     the statement without pagination, then stream the file back.
     
     For large datasets, this uses unlimited timeout and streaming to handle
-    exports that may take several minutes.
+    exports that may take several minutes. With ``background`` set the export
+    runs as a job instead: the response (202) carries the job id to poll at
+    ``/api/export/jobs/{job_id}`` and download from ``.../download``.
     """
 
     try:
         # 1. Determine SQL to execute
         sql = ""
         if request.query_id:
-            query_obj = QueryService.get_query_by_id(request.query_id)
+            query_obj = await QueryService.get_query_by_id_async(request.query_id)
             if not query_obj:
                 raise HTTPException(status_code=404, detail="Query not found")
 
@@ -233,81 +245,100 @@ async def export_query_data(request: ExportRequest, current_user: User = Depends
         else:
             raise HTTPException(status_code=400, detail="query_id or sql_query required")
 
-        # 2. Execute and get DataFrame – move the potentially long-running
-        # blocking DB call into a thread so this coroutine yields control.
+        # 2. Stream rows from the cursor into the requested format – the
+        # blocking fetches run in the thread pool so this coroutine yields.
 
         logger.info(
             f"Starting export for user {current_user.username}, estimated data size: large"
         )
 
-        loop = asyncio.get_running_loop()
         filename = request.filename or f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        df = await loop.run_in_executor(
-            None,  # default thread-pool executor
-            partial(db_manager.execute_query_pandas, sql, timeout=0),
-        )
-
-        if df.empty:
-            # For empty results, try to get column names by executing query with LIMIT 0
-            logger.info(f"Export query returned no data, attempting to get column headers for {filename}")
-            try:
-                # Extract the SELECT part and add LIMIT 0 to get just column structure
-                sql_for_headers = sql.strip()
-                if 'LIMIT' not in sql_for_headers.upper() and 'ROWNUM' not in sql_for_headers.upper():
-                    # Add WHERE 1=0 to get only column metadata in Oracle
-                    # Remove AS keyword for alias compatibility
-                    sql_for_headers = f"SELECT * FROM ({sql_for_headers}) sub WHERE 1=0"
-                
-                headers_df = await loop.run_in_executor(
-                    None,
-                    partial(db_manager.execute_query_pandas, sql_for_headers, timeout=10),
-                )
-                # Create empty DataFrame with proper column structure
-                if not headers_df.empty or len(headers_df.columns) > 0:
-                    df = pd.DataFrame(columns=headers_df.columns)
-                    logger.info(f"Empty file will have {len(df.columns)} columns: {list(df.columns)}")
-                else:
-                    # Fallback if we can't get headers
-                    import pandas as pd
-                    df = pd.DataFrame({"No Data": []})
-                    logger.warning(f"Could not determine column structure, using fallback")
-            except Exception as e:
-                logger.warning(f"Failed to get column headers for empty result: {e}")
-                import pandas as pd
-                df = pd.DataFrame({"No Data": []})
-        logger.info(f"Export query completed, processing {len(df)} rows for {filename}")
-
-        # 3. Convert to requested format and return
         fmt = request.format.lower()
-        if fmt == "excel":
-            if not filename.lower().endswith(".xlsx"):
-                filename += ".xlsx"
 
-            # Pandas writing to Excel is CPU-bound; offload to the same thread pool.
-            file_bytes: bytes = await loop.run_in_executor(
-                None, partial(ExportService.export_to_excel, df, filename)
+        spec = ExportService.EXPORT_FORMATS.get(fmt)
+        if spec is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported format; choose one of: {', '.join(ExportService.EXPORT_FORMATS)}",
             )
-            media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            logger.info(f"Excel export completed for {filename}, size: {len(file_bytes)} bytes")
-            return Response(content=file_bytes, media_type=media_type, headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Length": str(len(file_bytes))
-            })
-        elif fmt == "csv":
-            if not filename.lower().endswith(".csv"):
-                filename += ".csv"
-
-            csv_str: str = await loop.run_in_executor(
-                None, partial(ExportService.export_to_csv, df, filename)
+        partition = (request.partition or "").lower() or None
+        if partition is not None and partition not in ExportService.PARTITION_MODES:
+            raise HTTPException(status_code=400, detail="partition must be 'sheets' or 'files'")
+        if partition == "sheets" and fmt != "excel":
+            raise HTTPException(status_code=400, detail="Splitting across sheets is only available for Excel")
+        for extension in (spec["extension"], ".zip"):
+            if filename.lower().endswith(extension):
+                filename = filename[:-len(extension)]
+        base_name = filename
+        filename += ".zip" if partition == "files" else spec["extension"]
+
+        if request.background:
+            job = export_job_manager.submit(
+                sql,
+                fmt,
+                filename,
+                current_user.id,
+                partition=partition,
+                partition_rows=request.partition_rows,
+                parallel_slices=request.parallel_slices,
+            )
+            response.status_code = 202
+            return APIResponse(success=True, message="Export queued", data=job.to_dict())
+
+        if partition == "files":
+            # Parts are written in parallel and each one joins the ZIP stream
+            # as soon as it is complete; the first fetch runs up front so SQL
+            # errors still surface as a 500.
+            source = ExportService.export_source(fmt, sql, request.parallel_slices)
+            first_chunk = await run_in_threadpool(next, source)
+            logger.info(f"Streaming partitioned {fmt} export {filename}")
+            return StreamingResponse(
+                ExportService.iter_partitioned_zip(
+                    fmt, itertools.chain([first_chunk], source), request.partition_rows, base_name
+                ),
+                media_type="application/zip",
+                headers={"Content-Disposition": f"attachment; filename={filename}"},
             )
-            logger.info(f"CSV export completed for {filename}, size: {len(csv_str)} characters")
-            return Response(content=csv_str.encode("utf-8"), media_type="text/csv", headers={
-                "Content-Disposition": f"attachment; filename={filename}",
-                "Content-Length": str(len(csv_str.encode("utf-8")))
-            })
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported format; choose 'excel' or 'csv'")
+
+        if fmt == "csv":
+            # Rows go from the cursor to the client in fetchmany-sized chunks;
+            # pulling the header chunk first surfaces SQL errors as a 500
+            # before any bytes are sent.
+            chunks = ExportService.export_source(fmt, sql, request.parallel_slices)
+            first_chunk = await run_in_threadpool(next, chunks)
+            logger.info(f"Streaming CSV export {filename} with {len(first_chunk.columns)} columns")
+            return StreamingResponse(
+                ExportService.iter_csv(itertools.chain([first_chunk], chunks)),
+                media_type="text/csv",
+                headers={"Content-Disposition": f"attachment; filename={filename}"},
+            )
+
+        # Other formats are written incrementally to a temp file (Excel in
+        # xlsxwriter's constant-memory mode, Parquet/Arrow one batch at a
+        # time) and streamed back from disk, so neither the rows nor the
+        # finished file are held in memory.
+        fd, path = tempfile.mkstemp(prefix="export_", suffix=spec["extension"])
+        os.close(fd)
+        try:
+            rows = await run_in_threadpool(
+                ExportService.write_export,
+                fmt,
+                sql,
+                path,
+                partition=partition,
+                partition_rows=request.partition_rows,
+                parallel_slices=request.parallel_slices,
+            )
+        except Exception:
+            os.remove(path)
+            raise
+        logger.info(f"{fmt} export completed for {filename}: {rows} rows, {os.path.getsize(path)} bytes")
+        return FileResponse(
+            path,
+            filename=filename,
+            media_type=spec["media_type"],
+            background=BackgroundTask(os.remove, path),
+        )
 
     except HTTPException:
         raise
@@ -319,4 +350,88 @@ async def export_query_data(request: ExportRequest, current_user: User = Depends
             error_msg = "No data available to export."
         elif "timeout" in str(exc).lower():
             error_msg = "Export timed out. Try filtering your data to reduce the result set."
-        raise HTTPException(status_code=500, detail=error_msg)
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+# ------------------ Background Export Jobs ------------------
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _get_owned_job(job_id: str, current_user: User):
+    """Return the job if it exists and belongs to the user (admins see all)."""
+    job = export_job_manager.get(job_id)
+    if job is None or (job.owner_id != current_user.id and not is_admin(current_user.role)):
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+def _iter_file_range(path: str, start: int, length: int, block_size: int = 64 * 1024):
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        while length > 0:
+            block = fh.read(min(block_size, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+
+
+def _ranged_file_response(http_request: Request, path: str, filename: str, media_type: str) -> Response:
+    """Serve a file with single-range ``Range`` support so interrupted downloads can resume.
+
+    Requests without a usable single byte range get the whole file through
+    ``FileResponse`` (sendfile where the server supports it).
+    """
+    size = os.path.getsize(path)
+    match = _RANGE_RE.match(http_request.headers.get("range", "").strip())
+    if not match or match.groups() == ("", ""):
+        return FileResponse(path, filename=filename, media_type=media_type, headers={"Accept-Ranges": "bytes"})
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        # Suffix range: the last N bytes
+        start = max(size - int(last), 0)
+        end = size - 1 if int(last) else -1
+    if start >= size or start > end:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+
+    return StreamingResponse(
+        _iter_file_range(path, start, end - start + 1),
+        status_code=206,
+        media_type=media_type,
+        headers={
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{end}/{size}",
+            "Content-Length": str(end - start + 1),
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
+    )
+
+
+@router.get("/export/jobs", response_model=APIResponse)
+async def list_export_jobs(current_user: User = Depends(get_current_user)):
+    """List the current user's export jobs that have not expired."""
+    jobs = sorted(export_job_manager.list_for(current_user.id), key=lambda job: job.created_at, reverse=True)
+    return APIResponse(success=True, data=[job.to_dict() for job in jobs])
+
+
+@router.get("/export/jobs/{job_id}", response_model=APIResponse)
+async def get_export_job(job_id: str, current_user: User = Depends(get_current_user)):
+    """Status and progress (rows and bytes written) of an export job."""
+    job = _get_owned_job(job_id, current_user)
+    return APIResponse(success=True, data=job.to_dict())
+
+
+@router.get("/export/jobs/{job_id}/download")
+async def download_export_job(job_id: str, http_request: Request, current_user: User = Depends(get_current_user)):
+    """Download the finished file of an export job; supports ``Range`` requests."""
+    job = _get_owned_job(job_id, current_user)
+    if job.status != JOB_COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Export job is {job.status}")
+    if not os.path.exists(job.path):
+        raise HTTPException(status_code=410, detail="Export file has expired")
+    return _ranged_file_response(http_request, job.path, job.filename, job.media_type)
@@ -4,6 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException, Body, status
 
 from auth import require_admin, get_current_user
 from database import db_manager
+from metadata_cache import metadata_cache
+from principal_cache import principal_cache
 from roles_utils import serialize_roles
 from models import APIResponse, User
 import logging
@@ -41,14 +43,14 @@ def _update_comma_roles(table: str, id_col: str, role_col: str, old_role: str, n
     Returns number of updated rows.
     """
     try:
-        rows = db_manager.execute_query(
+        rows = db_manager.execute_query_rows(
             f"SELECT {id_col} AS id, {role_col} AS role FROM {table} WHERE {role_col} IS NOT NULL"
         )
     except Exception as exc:
         logger.warning(f"Skipping role update for table {table}: {exc}")
         return 0
 
-    updated = 0
+    updates = []
     for row in rows:
         role_val = row.get("role")
         if not role_val:
@@ -62,14 +64,13 @@ def _update_comma_roles(table: str, id_col: str, role_col: str, old_role: str, n
         else:
             parts = [p for p in parts if p != old_role.upper()]
 
-        new_serialized = serialize_roles(parts)
         # Write back (NULL if empty)
-        db_manager.execute_non_query(
-            f"UPDATE {table} SET {role_col} = :1 WHERE {id_col} = :2",
-            (new_serialized, row["id"]),
-        )
-        updated += 1
-    return updated
+        updates.append((serialize_roles(parts), row["id"]))
+
+    if updates:
+        db_manager.execute_many(f"UPDATE {table} SET {role_col} = :1 WHERE {id_col} = :2", updates)
+        metadata_cache.bump()
+    return len(updates)
 
 
 def _collect_distinct_roles() -> set[str]:
@@ -164,6 +165,7 @@ async def purge_stale_role(role_name: str, current_user: User = Depends(require_
             "UPDATE app_users SET role = 'USER' WHERE UPPER(role) = :1",
             (role_upper,),
         )
+        principal_cache.invalidate_role(role_upper)
 
         # Comma-separated role columns → remove occurrence
         q = _update_comma_roles("app_queries", "id", "role", role_upper, new_role=None)
@@ -283,6 +285,7 @@ async def delete_role(
                 "UPDATE app_users SET role = :1 WHERE UPPER(role) = UPPER(:2)",
                 (new_role.upper(), role_upper),
             )
+            principal_cache.invalidate_role(role_upper)
 
         # Cascade update in other tables holding comma-separated roles
         replaced_in_queries = _update_comma_roles(
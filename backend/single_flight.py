@@ -0,0 +1,107 @@
+"""Coalescing of identical concurrent calls.
+
+When a dashboard is opened by many users at once, the same widget query is
+requested dozens of times within a few milliseconds. ``SingleFlight`` lets
+the first caller for a key (the leader) run the call while later callers
+with the same key wait for and share its result, so the database sees one
+execution instead of one per request. Unlike the result cache, nothing is
+kept once the call finishes: a caller arriving afterwards runs it again.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight execution among concurrent callers with the same key.
+
+    ``do`` serves threads (the sync pools), ``do_async`` serves coroutines on
+    the event loop; the two keep separate in-flight tables.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[str, "asyncio.Task"] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` unless a call for ``key`` is already running; then wait for its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.waiters:
+                logger.info(f"Coalesced {call.waiters} concurrent calls into one execution")
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaitable variant of ``do``.
+
+        The leader's coroutine runs as its own task, so a disconnecting
+        leader does not cancel the execution the other callers are waiting on.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            with self._lock:
+                self.executions += 1
+        else:
+            with self._lock:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: "asyncio.Task") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = self.executions + self.coalesced
+            return {
+                "in_flight": len(self._calls) + len(self._tasks),
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "coalesced_ratio": round(self.coalesced / calls, 3) if calls else None,
+            }
+
+
+query_flight = SingleFlight()
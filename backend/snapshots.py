@@ -0,0 +1,227 @@
+"""Precomputed results for dashboard widgets and KPIs.
+
+Most widget and KPI queries read tables that only change when a new data
+batch is loaded, yet they used to run on every dashboard view. A query opts
+into materialization through its ``chart_config``::
+
+    {"snapshot_interval": 900,
+     "snapshot_version_sql": "SELECT MAX(data_batch) FROM sample_bt"}
+
+``snapshot_interval`` (seconds) is how often the refresher looks at the
+query. When ``snapshot_version_sql`` is given, that cheap query runs first
+and the real query is only re-run when its value changed; without it the
+query is re-run every interval. The widget and KPI endpoints serve the
+latest snapshot and report when it was taken; queries without a snapshot
+are computed live as before.
+
+Snapshots live in process memory and are rebuilt after a restart.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from config import settings
+from database import WORKLOAD_BULK, WORKLOAD_META, async_db_manager
+from models import QueryResult
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DEFINITIONS_SQL = """
+SELECT id, sql_query, chart_type, chart_config, is_kpi
+FROM app_queries
+WHERE is_active = 1 AND chart_config IS NOT NULL
+  AND DBMS_LOB.INSTR(chart_config, 'snapshot_interval') > 0
+"""
+
+
+class Snapshot:
+    """Latest materialized result of one ``app_queries`` row."""
+
+    __slots__ = ("query_id", "result", "value", "version", "taken_at", "duration")
+
+    def __init__(self, query_id: int, result: Optional[QueryResult], value: Optional[float], version: Any, duration: float):
+        self.query_id = query_id
+        # Widgets keep the chart result, KPIs the numeric value
+        self.result = result
+        self.value = value
+        self.version = version
+        self.taken_at = datetime.now()
+        self.duration = duration
+
+
+class _Schedule:
+    __slots__ = ("interval", "version_sql", "next_run", "refreshing")
+
+    def __init__(self, interval: float, version_sql: Optional[str]):
+        self.interval = interval
+        self.version_sql = version_sql
+        self.next_run = 0.0
+        self.refreshing = False
+
+
+class SnapshotRefresher:
+    """Background task that keeps snapshots of flagged queries up to date."""
+
+    def __init__(self, poll_interval: float, concurrency: int, query_timeout: int):
+        self.poll_interval = poll_interval
+        self.query_timeout = query_timeout
+        self._concurrency = concurrency
+        self._snapshots: Dict[int, Snapshot] = {}
+        self._schedules: Dict[int, _Schedule] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.refreshes = 0
+        self.skipped_unchanged = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        if self._task is None and self.poll_interval > 0:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._task = asyncio.ensure_future(self._loop())
+            logger.info(f"Snapshot refresher started (poll every {self.poll_interval}s)")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get(self, query_id: int) -> Optional[Snapshot]:
+        return self._snapshots.get(query_id)
+
+    def discard(self, query_id: int) -> None:
+        """Forget the snapshot of ``query_id`` (its SQL or config changed); it is rebuilt on the next poll."""
+        self._snapshots.pop(query_id, None)
+        schedule = self._schedules.get(query_id)
+        if schedule is not None:
+            schedule.next_run = 0.0
+
+    @staticmethod
+    def _parse_config(raw_config: Any) -> Dict[str, Any]:
+        try:
+            config = json.loads(raw_config) if isinstance(raw_config, str) else raw_config
+        except (TypeError, ValueError):
+            return {}
+        return config if isinstance(config, dict) else {}
+
+    @staticmethod
+    def _schedule_from_config(raw_config: Any) -> Optional[_Schedule]:
+        config = SnapshotRefresher._parse_config(raw_config)
+        try:
+            interval = float(config.get("snapshot_interval") or 0)
+        except (TypeError, ValueError):
+            return None
+        if interval <= 0:
+            return None
+        return _Schedule(interval, config.get("snapshot_version_sql") or None)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.refresh_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Snapshot refresh cycle failed: {exc}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def refresh_due(self) -> None:
+        """Reload the flagged definitions and refresh every snapshot that is due."""
+        rows = await async_db_manager.execute_query_rows(SNAPSHOT_DEFINITIONS_SQL, workload=WORKLOAD_META)
+        seen = set()
+        due = []
+        now = time.monotonic()
+        for row in rows:
+            schedule = self._schedule_from_config(row["chart_config"])
+            if schedule is None:
+                continue
+            query_id = row["id"]
+            seen.add(query_id)
+            current = self._schedules.get(query_id)
+            if current is not None:
+                current.interval, current.version_sql = schedule.interval, schedule.version_sql
+                schedule = current
+            else:
+                self._schedules[query_id] = schedule
+            if not schedule.refreshing and schedule.next_run <= now:
+                schedule.refreshing = True
+                due.append((row, schedule))
+
+        # Queries that were deactivated or lost their flag stop being served
+        for query_id in list(self._schedules):
+            if query_id not in seen:
+                del self._schedules[query_id]
+                self._snapshots.pop(query_id, None)
+
+        if due:
+            await asyncio.gather(*(self._refresh(row, schedule) for row, schedule in due))
+
+    async def _refresh(self, row: Dict[str, Any], schedule: _Schedule) -> None:
+        query_id = row["id"]
+        try:
+            async with self._semaphore:
+                previous = self._snapshots.get(query_id)
+                version = None
+                if schedule.version_sql:
+                    version_rows = await async_db_manager.execute_query_rows(
+                        schedule.version_sql, timeout=self.query_timeout
+                    )
+                    version = next(iter(version_rows[0].values())) if version_rows else None
+                    if previous is not None and version == previous.version:
+                        self.skipped_unchanged += 1
+                        return
+
+                start = time.time()
+                sql = row["sql_query"].strip().rstrip(";")
+                if row["is_kpi"]:
+                    # Imported here: services imports this module
+                    from services import KPIService
+
+                    value_rows = await async_db_manager.execute_query_rows(
+                        sql, timeout=self.query_timeout, workload=WORKLOAD_BULK
+                    )
+                    snapshot = Snapshot(
+                        query_id, None, KPIService._kpi_value_from_rows(value_rows, query_id), version, time.time() - start
+                    )
+                else:
+                    from services import DataService
+
+                    chart_config = self._parse_config(row["chart_config"])
+                    df = await async_db_manager.execute_query_pandas(
+                        sql, timeout=self.query_timeout, workload=WORKLOAD_BULK
+                    )
+                    result = DataService._build_chart_result(df, row["chart_type"], chart_config, start)
+                    snapshot = Snapshot(query_id, result, None, version, time.time() - start)
+
+                self._snapshots[query_id] = snapshot
+                self.refreshes += 1
+                logger.info(f"Snapshot of query {query_id} refreshed in {snapshot.duration:.2f}s")
+        except Exception as exc:
+            # Keep serving the previous snapshot; it is retried next interval
+            self.failures += 1
+            logger.error(f"Snapshot refresh of query {query_id} failed: {exc}")
+        finally:
+            schedule.next_run = time.monotonic() + schedule.interval
+            schedule.refreshing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "scheduled": len(self._schedules),
+            "materialized": len(self._snapshots),
+            "refreshes": self.refreshes,
+            "skipped_unchanged": self.skipped_unchanged,
+            "failures": self.failures,
+            "oldest": min((s.taken_at for s in self._snapshots.values()), default=None),
+        }
+
+
+snapshot_refresher = SnapshotRefresher(
+    settings.SNAPSHOT_POLL_INTERVAL, settings.SNAPSHOT_CONCURRENCY, settings.SNAPSHOT_QUERY_TIMEOUT
+)
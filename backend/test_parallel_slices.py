@@ -0,0 +1,52 @@
+import sqlite3
+import zlib
+from contextlib import contextmanager
+
+from database import DatabaseManager
+
+
+def _ora_hash(value, max_bucket=4294967295):
+    # Same NULL behaviour as Oracle: ORA_HASH(NULL) is NULL
+    if value is None:
+        return None
+    return zlib.crc32(str(value).encode()) % (int(max_bucket) + 1)
+
+
+class _SQLiteManager(DatabaseManager):
+    """DatabaseManager whose connections are an in-memory SQLite database with ORA_HASH/NVL."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    @contextmanager
+    def get_connection(self, timeout=None, workload=None):
+        yield self._conn
+
+
+def _combined_rows(partition_by, slices=4):
+    conn = sqlite3.connect(":memory:")
+    conn.create_function("ORA_HASH", 1, _ora_hash)
+    conn.create_function("ORA_HASH", 2, _ora_hash)
+    conn.create_function("NVL", 2, lambda value, default: default if value is None else value)
+    conn.execute("CREATE TABLE t (k TEXT, g INTEGER, v INTEGER)")
+    rows = [("a", 1, 1), (None, 1, 2), ("b", None, 3), (None, None, 4), ("c", 2, 5)]
+    conn.executemany("INSERT INTO t VALUES (?, ?, ?)", rows)
+
+    manager = _SQLiteManager(conn)
+    _, plan = manager._plan_slices(
+        "SELECT k, g, v FROM t", {}, slices, "hash", None, partition_by, None, 10, None
+    )
+    combined = []
+    for slice_sql, binds in plan:
+        combined.extend(conn.execute(slice_sql, binds).fetchall())
+    return rows, combined
+
+
+def test_slices_keep_rows_with_null_single_key():
+    rows, combined = _combined_rows(["k"])
+    assert sorted(combined, key=lambda r: r[2]) == rows
+
+
+def test_slices_keep_rows_with_null_composite_key():
+    rows, combined = _combined_rows(["k", "g"])
+    assert sorted(combined, key=lambda r: r[2]) == rows